@@ -0,0 +1,80 @@
+"""JSON helpers shared by the CLI entry points.
+
+Uses `orjson` (optional `fast` extra) to parse module files straight from
+bytes, falling back to the stdlib `json` module. Output is always written by the
+stdlib, so it looks the same with or without the extra and keeps NaN/Infinity
+(orjson would write them as null).
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import IO, Any, Iterable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (64-bit ints, no NaN/Infinity); let the stdlib
+            # either accept the document or raise its usual error
+            pass
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def load_path(path: Union[str, Path]) -> Any:
+    return loads(Path(path).read_bytes())
+
+
+def dumps_key(obj: Any) -> Optional[bytes]:
+    """Compact JSON bytes identifying `obj` exactly, for use as a cache key.
+
+    Meant for JSON data as loaded from a file (tuples encode like lists).
+    Returns None for values the encoding could confuse with another: NaN and
+    Infinity, non-string keys and non-JSON objects.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(
+                obj,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            )
+        except TypeError:
+            return None
+        if b"null" not in data:
+            return data
+        # orjson writes NaN and Infinity as null; let the stdlib reject them
+    try:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+
+
+def dumps_indented(obj: Any) -> str:
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def write_indented_array(items: Iterable[Any], fp: IO[str]) -> int:
+    """Write `items` as an indented JSON array one element at a time.
+
+    The output matches `dumps_indented(list(items))` (plus a trailing newline),
+    but the list is never built and each element is flushed as it arrives.
+    Returns the number of elements written.
+    """
+    n = 0
+    for item in items:
+        fp.write("[\n" if n == 0 else ",\n")
+        fp.write("\n".join("  " + line for line in dumps_indented(item).split("\n")))
+        fp.flush()
+        n += 1
+    fp.write("\n]\n" if n else "[]\n")
+    return n
@@ -0,0 +1,41 @@
+"""Small helpers over the Astra JSON-AST shared by the execution tools."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict, List
+
+
+def canonicalize_module(module: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern the identifier strings of `module` in place and return it.
+
+    Function names, parameters, `let` names, `var` references and `call.fn`
+    are replaced by equal interned strings, so later dict lookups keyed by them
+    (function tables, environments, `BUILTINS`) can match by identity. The
+    module's JSON value is unchanged: nothing is added, so it still validates
+    and prints exactly as before.
+    """
+    intern = sys.intern
+    stack: List[Any] = [module]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        for key in ("fn", "var", "name"):
+            v = node.get(key)
+            if type(v) is str:
+                node[key] = intern(v)
+        params = node.get("params")
+        if isinstance(params, list):
+            for i, p in enumerate(params):
+                if type(p) is str:
+                    params[i] = intern(p)
+
+        for v in node.values():
+            if isinstance(v, (dict, list)):
+                stack.append(v)
+    return module
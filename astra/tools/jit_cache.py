@@ -0,0 +1,174 @@
+"""Optional Numba fast path for numeric user functions (used by `sandbox_ast`).
+
+`list_map("f", xs)` normally calls back into the interpreter once per element.
+When `f` is plain float arithmetic, this module translates it to a tiny Python
+function, compiles it with `numba.njit` and maps it over the whole list in one
+native loop.
+
+A function is eligible when:
+- it takes exactly one parameter
+- its body is zero or more `let` statements followed by a single `return`
+- every expression is a number literal, a variable, or add/sub/mul/div
+- every arithmetic node has a float operand (so no int64 overflow can differ
+  from Python's unbounded ints)
+
+The fast path is used only for homogeneous float lists of at least
+`MIN_JIT_LEN` elements. Anything else (ineligible function, typing failure,
+runtime error such as division by zero) returns None and the caller falls back
+to the interpreter, which reproduces the exact Python semantics and errors.
+
+Requires the optional `numba` and `numpy` packages; without them `available()`
+is False and nothing here is used.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional
+
+# Imported lazily by `available()`: numba is slow to import and most runs never
+# ask for the fast path.
+numba: Any = None
+np: Any = None
+_import_tried = False
+
+
+# Below this length the interpreter is cheaper than entering native code.
+MIN_JIT_LEN = 256
+
+_NUMERIC_BUILTINS: Dict[str, str] = {"add": "+", "sub": "-", "mul": "*", "div": "/"}
+
+# Exactly representable as float64 in both Python and numba.
+_MAX_INT_LITERAL = 2**53
+
+# Compiled mappers keyed by generated source (None = failed to compile).
+_CACHE: Dict[str, Optional[Callable[[Any], Any]]] = {}
+
+
+def available() -> bool:
+    global numba, np, _import_tried
+    if not _import_tried:
+        _import_tried = True
+        try:
+            import numba as _numba
+            import numpy as _np
+        except ImportError:
+            return False
+        numba, np = _numba, _np
+    return numba is not None
+
+
+def _qual_last(name: str) -> str:
+    return name.rsplit(".", 1)[-1]
+
+
+def _gen_expr(expr: Any, names: Dict[str, str], floats: Dict[str, bool]) -> Optional[tuple]:
+    """Return (python_source, is_float) or None if not eligible."""
+    if isinstance(expr, bool):
+        return None
+    if isinstance(expr, float):
+        return repr(expr), True
+    if isinstance(expr, int):
+        if abs(expr) >= _MAX_INT_LITERAL:
+            return None
+        return repr(expr), False
+    if not isinstance(expr, dict) or len(expr) != 1:
+        return None
+
+    if "var" in expr:
+        py = names.get(expr["var"]) if isinstance(expr["var"], str) else None
+        if py is None:
+            return None
+        return py, floats[py]
+
+    call = expr.get("call")
+    if not isinstance(call, dict) or not isinstance(call.get("fn"), str):
+        return None
+    op = _NUMERIC_BUILTINS.get(_qual_last(call["fn"]))
+    args = call.get("args")
+    if op is None or not isinstance(args, list) or len(args) != 2:
+        return None
+    a = _gen_expr(args[0], names, floats)
+    b = _gen_expr(args[1], names, floats)
+    if a is None or b is None or not (a[1] or b[1]):
+        return None
+    return f"({a[0]} {op} {b[0]})", True
+
+
+def _gen_source(fn: Dict[str, Any]) -> Optional[str]:
+    params = fn.get("params")
+    body = fn.get("body")
+    if not isinstance(params, list) or len(params) != 1 or not isinstance(params[0], str):
+        return None
+    if not isinstance(body, list) or not body:
+        return None
+
+    names: Dict[str, str] = {params[0]: "p0"}
+    floats: Dict[str, bool] = {"p0": True}
+    lines = ["def _astra_jit(p0):"]
+    for i, stmt in enumerate(body):
+        if not isinstance(stmt, dict) or len(stmt) != 1:
+            return None
+        last = i == len(body) - 1
+        if last and "return" in stmt:
+            out = _gen_expr(stmt["return"], names, floats)
+            if out is None or not out[1]:
+                return None
+            lines.append(f"    return {out[0]}")
+            return "\n".join(lines) + "\n"
+        spec = stmt.get("let")
+        if last or not isinstance(spec, dict) or not isinstance(spec.get("name"), str):
+            return None
+        out = _gen_expr(spec.get("expr"), names, floats)
+        if out is None:
+            return None
+        py = f"v{i}"
+        lines.append(f"    {py} = {out[0]}")
+        names[spec["name"]] = py
+        floats[py] = out[1]
+    return None
+
+
+def _make_mapper(scalar: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    @numba.njit
+    def _map(arr):  # pragma: no cover - compiled by numba
+        out = np.empty(arr.size, dtype=np.float64)
+        for i in range(arr.size):
+            out[i] = scalar(arr[i])
+        return out
+
+    return _map
+
+
+def compile_mapper(fn: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """Return a native `array -> array` mapper for an eligible function, else None."""
+    if not available():
+        return None
+    src = _gen_source(fn)
+    if src is None:
+        return None
+    if src in _CACHE:
+        return _CACHE[src]
+    ns: Dict[str, Any] = {}
+    try:
+        # Source only contains mangled names, number literals and + - * /.
+        exec(compile(src, "<astra-jit>", "exec"), {"__builtins__": {}}, ns)
+        mapper: Optional[Callable[[Any], Any]] = _make_mapper(numba.njit(ns["_astra_jit"]))
+    except Exception:
+        mapper = None
+    _CACHE[src] = mapper
+    return mapper
+
+
+def map_floats(mapper: Callable[[Any], Any], xs: Any) -> Optional[List[float]]:
+    """Apply mapper to a homogeneous float list, or return None to fall back."""
+    if type(xs) is not list or len(xs) < MIN_JIT_LEN:
+        return None
+    for x in xs:
+        if type(x) is not float:
+            return None
+    try:
+        return mapper(np.asarray(xs, dtype=np.float64)).tolist()
+    except Exception:
+        # typing failure or a runtime error (e.g. division by zero): let the
+        # interpreter run and raise with its usual semantics
+        return None
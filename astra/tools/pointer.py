@@ -40,10 +40,13 @@ def split_pointer(pointer: str) -> List[str]:
 def join_pointer(segments: List[Union[str, int]]) -> str:
     if not segments:
         return ""
-    out: List[str] = []
-    for s in segments:
-        out.append(escape_segment(str(s)))
-    return "/" + "/".join(out)
+    parts = [str(s) for s in segments]
+    joined = "/".join(parts)
+    # segments rarely need escaping: only redo the join when one contains
+    # '~' or '/' (the latter shows up as an extra separator)
+    if "~" in joined or joined.count("/") != len(parts) - 1:
+        joined = "/".join([escape_segment(s) for s in parts])
+    return "/" + joined
 
 
 def _coerce_index(seg: str, cur: Any) -> Union[str, int]:
@@ -1,7 +1,11 @@
+import functools
 import json
 import re
 from typing import Any, Dict, List
 
+# Printable ASCII that JSON emits verbatim (no '"', no backslash, no controls).
+_SAFE = re.compile(r'[\x20-\x21\x23-\x5B\x5D-\x7E]*')
+
 
 def _indent(lines: List[str], n: int) -> List[str]:
     pref = "  " * n
@@ -18,6 +22,13 @@ def _qual_last(name: Any) -> str:
     return name.rsplit(".", 1)[-1]
 
 
+@functools.lru_cache(maxsize=4096)
+def _json_str(s: str) -> str:
+    if _SAFE.fullmatch(s):
+        return '"' + s + '"'
+    return json.dumps(s, ensure_ascii=False)
+
+
 def _expr(expr: Any) -> str:
     if expr is None:
         return "null"
@@ -26,7 +37,7 @@ def _expr(expr: Any) -> str:
     if isinstance(expr, (int, float)) and not isinstance(expr, bool):
         return str(expr)
     if isinstance(expr, str):
-        return json.dumps(expr, ensure_ascii=False)
+        return _json_str(expr)
 
     if not isinstance(expr, dict):
         return "<invalid>"
@@ -73,7 +84,7 @@ def _stmt(stmt: Any, indent: int = 0) -> List[str]:
     if tag == "assert":
         msg = val.get("message")
         if isinstance(msg, str):
-            return _indent([f"assert {_expr(val.get('expr'))} : {json.dumps(msg, ensure_ascii=False)}"], indent)
+            return _indent([f"assert {_expr(val.get('expr'))} : {_json_str(msg)}"], indent)
         return _indent([f"assert {_expr(val.get('expr'))}"], indent)
 
     if tag == "return":
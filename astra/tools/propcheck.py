@@ -93,18 +93,37 @@ def gen_value(t: Type, rnd: random.Random, max_size: int, *, typevar_defaults: O
 # Shrinking
 # -------------------------
 
+# Above this magnitude, try halving before the tiny constants so the failing
+# region is bracketed quickly; at or below _SHRINK_STEP_MAX, also try the
+# neighbour one step closer to zero to pin down off-by-one boundaries.
+_SHRINK_HALVE_FIRST = 1000
+_SHRINK_STEP_MAX = 16
+
+
 def shrink_int(n: int) -> Iterable[int]:
     if n == 0:
         return
-    yield 0
-    yield 1
-    yield -1
-    # move toward 0
-    cur = n
-    while cur != 0:
-        cur = int(cur / 2)
-        if cur != 0:
-            yield cur
+    sign = 1 if n > 0 else -1
+    mag = abs(n)
+    # move toward 0: n//2, n//4, ... (O(log|n|) candidates)
+    halves = [sign * (mag >> k) for k in range(1, mag.bit_length())]
+
+    cands: List[int] = [0]
+    if mag > _SHRINK_HALVE_FIRST:
+        cands.append(halves[0])
+    cands.extend((1, -1))
+    cands.extend(halves)
+    if mag <= _SHRINK_STEP_MAX:
+        cands.append(n - sign)
+
+    # keep candidates strictly closer to 0 than n, plus -n for negative n: the
+    # magnitude never grows and only drops its sign once, so greedy shrinking
+    # terminates (1 and -1 must not shrink into each other)
+    seen = {n}
+    for c in cands:
+        if c not in seen and (abs(c) < mag or c == -n > 0):
+            seen.add(c)
+            yield c
 
 
 def shrink_list(xs: List[Any]) -> Iterable[List[Any]]:
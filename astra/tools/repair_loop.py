@@ -16,22 +16,44 @@ This tool is designed so you can run it locally where an LLM endpoint is availab
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from astra.tools import fmt, semantic, typecheck, effects, test_runner
+from astra.tools import _json, fmt, semantic, typecheck, effects, test_runner
 from astra.tools.llm_providers import make_provider
 from astra.tools.pointer import apply_patch
 from astra.tools.repair_suggest import suggest_patches
 
+# The LLM only needs the most severe issues to make progress; listing every
+# warning on a large module bloats the prompt (and its serialization cost).
+PROMPT_MAX_ISSUES = 50
 
-def collect_issues(module: Dict[str, Any], *, validate_schema: bool = True, allowed_effects: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+
+@functools.lru_cache(maxsize=1)
+def _schema() -> Dict[str, Any]:
+    # The packaged schema is static for the lifetime of the process.
+    return fmt.load_schema()
+
+
+def _issue_sort_key(issue: Dict[str, Any]) -> Tuple[str, str, str]:
+    return (issue.get("severity", "error"), issue.get("code", ""), issue.get("pointer", ""))
+
+
+def collect_issues(
+    module: Dict[str, Any],
+    *,
+    validate_schema: bool = True,
+    allowed_effects: Optional[List[str]] = None,
+    schema: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
     issues: List[Dict[str, Any]] = []
     if validate_schema:
-        schema = fmt.load_schema()
+        if schema is None:
+            schema = _schema()
         errs = fmt.validate(module, schema)
         for e in errs:
             issues.append(
@@ -53,19 +75,31 @@ def collect_issues(module: Dict[str, Any], *, validate_schema: bool = True, allo
     issues.extend(test_runner.run_tests(module, allowed_effects))
 
     # stable order
-    issues.sort(key=lambda i: (i.get("severity", "error"), i.get("code", ""), i.get("pointer", "")))
+    if len(issues) > 1:
+        issues.sort(key=_issue_sort_key)
     return issues
 
 
-def build_prompt(module: Dict[str, Any], issues: List[Dict[str, Any]]) -> str:
+def _prompt_issues(issues: List[Dict[str, Any]], max_issues: Optional[int]) -> List[Dict[str, Any]]:
+    if max_issues is None or len(issues) <= max_issues:
+        return issues
+    severity_rank = {"error": 0, "warning": 1}
+    ranked = sorted(issues, key=lambda i: severity_rank.get(i.get("severity", "error"), 2))
+    return ranked[:max_issues]
+
+
+def build_prompt(module: Dict[str, Any], issues: List[Dict[str, Any]], *, max_issues: Optional[int] = None) -> str:
+    shown = _prompt_issues(issues, max_issues)
+    omitted = len(issues) - len(shown)
     return (
         "You are repairing an Astra JSON-AST module.\n"
         "Return ONLY a JSON array of JSON Patch operations (RFC6902 subset: add/replace/remove).\n"
         "No prose, no markdown.\n\n"
         "Astra module JSON:\n"
-        + json.dumps(module, indent=2, ensure_ascii=False)
+        + _json.dumps_indented(module)
         + "\n\nIssues (JSON):\n"
-        + json.dumps(issues, indent=2, ensure_ascii=False)
+        + _json.dumps_indented(shown)
+        + (f"\n({omitted} more issues omitted)" if omitted else "")
         + "\n\nConstraints:\n"
         "- Preserve module semantics unless needed to fix errors\n"
         "- Prefer minimal changes\n"
@@ -84,9 +118,10 @@ def repair_loop(
     provider = make_provider(provider_kind, cmd=provider_cmd)
 
     history: List[Dict[str, Any]] = []
+    schema = _schema()
 
     for it in range(max_iters):
-        issues = collect_issues(module, allowed_effects=allowed_effects)
+        issues = collect_issues(module, allowed_effects=allowed_effects, schema=schema)
         history.append({"iter": it, "issue_count": len(issues), "issues": issues})
 
         errors = [i for i in issues if i.get("severity") == "error"]
@@ -100,7 +135,7 @@ def repair_loop(
             continue
 
         # 2) LLM patches
-        prompt = build_prompt(module, issues)
+        prompt = build_prompt(module, issues, max_issues=PROMPT_MAX_ISSUES)
         llm_patch = provider.propose_patches(prompt)
         if not llm_patch:
             break
@@ -15,16 +15,29 @@ It is deliberately conservative.
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 from astra.tools.pointer import apply_patch
 from astra.tools import effects
 
 
-def suggest_patches(module: Dict[str, Any], issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    patches: List[Dict[str, Any]] = []
+def _canonical(v: Any) -> Hashable:
+    """Hashable form of a JSON value, used as a dedup key.
+
+    Object key order is ignored; list order is kept. Scalars are keyed with
+    their type (so `true`, `1` and `1.0` stay distinct) and floats by their
+    exact hex form (so `0.0` and `-0.0` differ).
+    """
+    if isinstance(v, list):
+        return ("list", tuple(_canonical(x) for x in v))
+    if isinstance(v, dict):
+        return ("dict", tuple(sorted((k, _canonical(w)) for k, w in v.items())))
+    if type(v) is float:
+        return (float, v.hex())
+    return (type(v), v)
+
 
+def suggest_patches(module: Dict[str, Any], issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     # Precompute transitive effects only if needed.
     need_effects_map = any(it.get("code") == "MissingEffect" for it in issues)
     effects_map: Dict[str, Any] = {}
@@ -34,73 +47,86 @@ def suggest_patches(module: Dict[str, Any], issues: List[Dict[str, Any]]) -> Lis
         except Exception:
             effects_map = {}
 
-    # MissingReturn -> append return null
-    for it in issues:
-        if it.get("code") == "MissingReturn":
-            ptr = it.get("pointer", "")
-            # pointer like /functions/3
-            parts = [p for p in ptr.strip("/").split("/") if p]
-            if len(parts) >= 2 and parts[0] == "functions" and parts[1].isdigit():
-                fi = int(parts[1])
-                patches.append(
-                    {
-                        "op": "add",
-                        "path": f"/functions/{fi}/body/-",
-                        "value": {"return": None},
-                    }
-                )
-
-    # NotPure -> remove 'pure' from declared effects (minimal remove patch)
-    for it in issues:
-        if it.get("code") == "NotPure":
-            ptr = it.get("pointer", "")
-            parts = [p for p in ptr.strip("/").split("/") if p]
-            if len(parts) >= 3 and parts[0] == "functions" and parts[1].isdigit() and parts[2] == "effects":
-                fi = int(parts[1])
-                fn = (module.get("functions", []) or [])[fi]
-                eff = fn.get("effects", []) if isinstance(fn, dict) else []
-                if isinstance(eff, list) and "pure" in eff and len(eff) > 1:
-                    idx = eff.index("pure")
-                    patches.append({"op": "remove", "path": f"/functions/{fi}/effects/{idx}"})
-
-    # MissingEffect -> add required missing effects by replacing the list (single patch)
+    functions_list = module.get("functions", []) or []
+    declared_effects_cache: Dict[int, List[str]] = {}
+
+    def declared_effects(fi: int, fn: Dict[str, Any]) -> List[str]:
+        eff = declared_effects_cache.get(fi)
+        if eff is None:
+            raw = fn.get("effects", [])
+            eff = raw if isinstance(raw, list) else []
+            declared_effects_cache[fi] = eff
+        return eff
+
+    # Patches are bucketed per issue kind so they apply in a fixed order:
+    # index-based removes must run before whole-list replaces of the same effects.
+    add_returns: List[Dict[str, Any]] = []
+    remove_pure: List[Dict[str, Any]] = []
+    replace_effects: List[Dict[str, Any]] = []
+
     for it in issues:
-        if it.get("code") == "MissingEffect":
-            ptr = it.get("pointer", "")
-            parts = [p for p in ptr.strip("/").split("/") if p]
-            if len(parts) >= 3 and parts[0] == "functions" and parts[1].isdigit() and parts[2] == "effects":
-                fi = int(parts[1])
-                fn = (module.get("functions", []) or [])[fi]
-                if not isinstance(fn, dict):
-                    continue
-                name = fn.get("name")
-                if not isinstance(name, str):
-                    continue
-                required = set(effects_map.get(name, set()) or set())
-                declared_list = fn.get("effects", [])
-                if not isinstance(declared_list, list):
-                    declared_list = []
-                declared = list(declared_list)
-                if not declared:
-                    declared = ["pure"]
-                missing = required - set(declared)
-                if not missing:
-                    continue
-                new_eff = list(declared)
-                for m in sorted(missing):
-                    if m not in new_eff:
-                        new_eff.append(m)
-
-                # If adding any non-pure effects, drop 'pure' to avoid NotPure warnings.
-                if "pure" in new_eff and len(new_eff) > 1:
-                    new_eff = [e for e in new_eff if e != "pure"]
-                patches.append({"op": "replace", "path": f"/functions/{fi}/effects", "value": new_eff})
+        code = it.get("code")
+        if code not in ("MissingReturn", "NotPure", "MissingEffect"):
+            continue
+        # pointer like /functions/3 or /functions/3/effects
+        parts = [p for p in it.get("pointer", "").strip("/").split("/") if p]
+        fi = int(parts[1]) if len(parts) >= 2 and parts[0] == "functions" and parts[1].isdigit() else None
+        if fi is None:
+            continue
+
+        # MissingReturn -> append return null
+        if code == "MissingReturn":
+            add_returns.append(
+                {
+                    "op": "add",
+                    "path": f"/functions/{fi}/body/-",
+                    "value": {"return": None},
+                }
+            )
+            continue
+
+        if len(parts) < 3 or parts[2] != "effects" or fi >= len(functions_list):
+            continue
+        fn = functions_list[fi]
+        if not isinstance(fn, dict):
+            continue
+
+        # NotPure -> remove 'pure' from declared effects (minimal remove patch)
+        if code == "NotPure":
+            eff = declared_effects(fi, fn)
+            if "pure" in eff and len(eff) > 1:
+                idx = eff.index("pure")
+                remove_pure.append({"op": "remove", "path": f"/functions/{fi}/effects/{idx}"})
+            continue
+
+        # MissingEffect -> add required missing effects by replacing the list (single patch)
+        name = fn.get("name")
+        if not isinstance(name, str):
+            continue
+        required = set(effects_map.get(name, set()) or set())
+        declared = list(declared_effects(fi, fn))
+        if not declared:
+            declared = ["pure"]
+        missing = required - set(declared)
+        if not missing:
+            continue
+        new_eff = list(declared)
+        for m in sorted(missing):
+            if m not in new_eff:
+                new_eff.append(m)
+
+        # If adding any non-pure effects, drop 'pure' to avoid NotPure warnings.
+        if "pure" in new_eff and len(new_eff) > 1:
+            new_eff = [e for e in new_eff if e != "pure"]
+        replace_effects.append({"op": "replace", "path": f"/functions/{fi}/effects", "value": new_eff})
+
+    patches = add_returns + remove_pure + replace_effects
 
     # De-duplicate patches (simple)
     seen = set()
     uniq: List[Dict[str, Any]] = []
     for p in patches:
-        key = json.dumps(p, sort_keys=True, ensure_ascii=False)
+        key = (p["op"], p["path"], _canonical(p.get("value")))
         if key not in seen:
             uniq.append(p)
             seen.add(key)
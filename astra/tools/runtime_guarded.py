@@ -21,6 +21,8 @@ Builtin names are strings to avoid Python keyword conflicts (e.g., "and").
 
 from __future__ import annotations
 
+import urllib.error
+import urllib.parse
 import urllib.request
 from typing import Any, Callable, Dict, List, Optional, Set
 
@@ -29,18 +31,28 @@ class EffectError(RuntimeError):
     pass
 
 
+# The builtin effects get one bit each; any other (host-defined) effect name
+# is checked against the allowlist set instead.
+_EFFECT_BITS: Dict[str, int] = {"pure": 1 << 0, "io.print": 1 << 1, "net.http": 1 << 2}
+
 _allowed_effects: Set[str] = {"pure"}
+_allowed_mask: int = _EFFECT_BITS["pure"]
 
 
 def set_allowed_effects(effects: List[str]) -> None:
-    global _allowed_effects
+    global _allowed_effects, _allowed_mask
     _allowed_effects = set(effects or [])
     if not _allowed_effects:
         _allowed_effects = {"pure"}
+    mask = 0
+    for e in _allowed_effects:
+        mask |= _EFFECT_BITS.get(e, 0)
+    _allowed_mask = mask
 
 
 def require(effect: str) -> None:
-    if effect not in _allowed_effects:
+    bit = _EFFECT_BITS.get(effect)
+    if not (_allowed_mask & bit if bit is not None else effect in _allowed_effects):
         raise EffectError(f"Effect '{effect}' is not allowed (allowed={sorted(_allowed_effects)})")
 
 
@@ -164,11 +176,18 @@ def list_set(xs: List[Any], i: int, v: Any) -> List[Any]:
 
 
 def list_append(xs: List[Any], v: Any) -> List[Any]:
-    return list(xs) + [v]
+    out = list(xs)
+    out.append(v)
+    return out
 
 
 def list_concat(xs: List[Any], ys: List[Any]) -> List[Any]:
-    return list(xs) + list(ys)
+    if type(xs) is list and type(ys) is list:
+        # `+` already builds a fresh list; skip the two intermediate copies
+        return xs + ys
+    out = list(xs)
+    out.extend(ys)
+    return out
 
 
 def list_slice(xs: List[Any], start: Any, end: Any) -> List[Any]:
@@ -192,26 +211,36 @@ def list_mean(xs: List[Any]) -> float:
     return float(sum(xs)) / float(len(xs))
 
 
+def _builtin_for(fn: str) -> Optional[Callable[..., Any]]:
+    # Dispatchers resolve builtins before user functions, so a builtin callback
+    # can be bound once per call instead of going through the dispatcher per item.
+    return BUILTINS.get(fn.rsplit(".", 1)[-1])
+
+
 def list_map(fn: str, xs: List[Any]) -> List[Any]:
     disp = _need_dispatch()
-    out: List[Any] = []
-    for x in xs:
-        out.append(disp(fn, [x]))
-    return out
+    f = _builtin_for(fn)
+    if f is not None:
+        return [f(x) for x in xs]
+    return [disp(fn, [x]) for x in xs]
 
 
 def list_filter(fn: str, xs: List[Any]) -> List[Any]:
     disp = _need_dispatch()
-    out: List[Any] = []
-    for x in xs:
-        if disp(fn, [x]):
-            out.append(x)
-    return out
+    f = _builtin_for(fn)
+    if f is not None:
+        return [x for x in xs if f(x)]
+    return [x for x in xs if disp(fn, [x])]
 
 
 def list_reduce(fn: str, init: Any, xs: List[Any]) -> Any:
     disp = _need_dispatch()
+    f = _builtin_for(fn)
     acc = init
+    if f is not None:
+        for x in xs:
+            acc = f(acc, x)
+        return acc
     for x in xs:
         acc = disp(fn, [acc, x])
     return acc
@@ -239,19 +268,23 @@ def obj_set(o: Dict[str, Any], key: str, value: Any) -> Dict[str, Any]:
 
 
 def obj_del(o: Dict[str, Any], key: str) -> Dict[str, Any]:
-    if key not in o:
-        return dict(o)
     out = dict(o)
-    del out[key]
+    out.pop(key, None)
     return out
 
 
 def obj_keys(o: Dict[str, Any]) -> List[str]:
     # stable order for deterministic behavior
-    return sorted(list(o.keys()))
+    return sorted(o.keys())
 
 
 def obj_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    # one side an empty object (typical when accumulating with list_reduce):
+    # single copy
+    if type(b) is dict and not b:
+        return dict(a)
+    if type(a) is dict and not a:
+        return dict(b)
     out = dict(a)
     out.update(b)
     return out
@@ -268,10 +301,52 @@ def builtin_print(x: Any) -> None:
     return None
 
 
+# Keep-alive connection pool shared by http_get when urllib3 is installed
+# (imported on first use; False once the import has failed).
+_urllib3: Any = None
+_http_pool: Any = None
+
+
+def _http_get_pooled(url: str) -> Optional[bytes]:
+    """GET `url` through the shared urllib3 pool.
+
+    Returns None when the request should go through `urlopen` instead: for
+    non-HTTP URLs, when urllib3 is not installed, or when a proxy from the
+    environment applies (the pool does not read `http_proxy`/`no_proxy`).
+    Failures are raised as `urllib.error.URLError`, as `urlopen` does.
+    """
+    global _urllib3, _http_pool
+    scheme = url.partition("://")[0].lower()
+    if _urllib3 is False or scheme not in ("http", "https"):
+        return None
+    if scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(urllib.parse.urlsplit(url).hostname or ""):
+        return None
+    if _http_pool is None:
+        try:
+            import urllib3
+        except ImportError:
+            _urllib3 = False
+            return None
+        _urllib3 = urllib3
+        # no retries of any kind, but follow redirects like urlopen does (no
+        # overall `total`, or redirects would count against it)
+        retries = urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=10)
+        _http_pool = urllib3.PoolManager(maxsize=8, retries=retries)
+    try:
+        resp = _http_pool.request("GET", url)
+    except _urllib3.exceptions.HTTPError as e:
+        raise urllib.error.URLError(getattr(e, "reason", None) or e) from e
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason or "", resp.headers, None)
+    return resp.data
+
+
 def http_get(url: str) -> str:
     require("net.http")
-    with urllib.request.urlopen(url) as resp:
-        data = resp.read()
+    data = _http_get_pooled(url)
+    if data is None:
+        with urllib.request.urlopen(url) as resp:
+            data = resp.read()
     try:
         return data.decode("utf-8")
     except Exception:
@@ -328,6 +403,7 @@ BUILTINS: Dict[str, Callable[..., Any]] = {
 
 
 def call_builtin(name: str, args: List[Any]) -> Any:
-    if name not in BUILTINS:
+    f = BUILTINS.get(name)
+    if f is None:
         raise KeyError(f"Unknown builtin: {name}")
-    return BUILTINS[name](*args)
+    return f(*args)
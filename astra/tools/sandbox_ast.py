@@ -1,9 +1,14 @@
 """AST interpreter sandbox for Astra.
 
-This interpreter executes the JSON-AST directly.
+This interpreter executes the JSON-AST without generating Python source:
+`run_module` lowers each called function to a flat instruction list once and
+runs it in a small dispatch loop; `eval_expr`/`exec_stmt` walk the AST directly.
 It enforces effects by delegating builtins to `runtime_guarded`,
 which checks an allowlist set by the host.
 
+`run_module_fast` trades that property for speed by delegating to the Python
+codegen sandbox; the interpreter remains the default.
+
 Use cases:
 - Deterministic execution for property tests
 - Safe-ish execution when you do not want to execute generated Python code
@@ -16,13 +21,15 @@ Limitations:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+from astra.tools import _json, jit_cache
 from astra.tools import runtime_guarded as rt
+from astra.tools.ast_utils import canonicalize_module
 
 
 class ReturnSignal(Exception):
@@ -35,8 +42,48 @@ class SandboxError(RuntimeError):
     pass
 
 
+# Call sites repeat the same few names, so memoize (and intern) the split.
+@functools.lru_cache(maxsize=2048)
 def _qual_last(name: str) -> str:
-    return name.split(".")[-1]
+    return sys.intern(name.rsplit(".", 1)[-1])
+
+
+def _eval_var(expr: Dict[str, Any], env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> Any:
+    name = expr["var"]
+    if name not in env:
+        raise SandboxError(f"Undefined variable: {name}")
+    return env[name]
+
+
+def _eval_list(expr: Dict[str, Any], env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> Any:
+    return [eval_expr(x, env, fns) for x in expr["list"]]
+
+
+def _eval_obj(expr: Dict[str, Any], env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> Any:
+    return {k: eval_expr(v, env, fns) for k, v in expr["obj"].items()}
+
+
+def _eval_call(expr: Dict[str, Any], env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> Any:
+    call = expr["call"]
+    fn = _qual_last(call["fn"])
+    args = [eval_expr(a, env, fns) for a in call.get("args", [])]
+    # builtin
+    builtin = rt.BUILTINS.get(fn)
+    if builtin is not None:
+        return builtin(*args)
+    # user fn
+    if fn not in fns:
+        raise SandboxError(f"Unknown function: {fn}")
+    return call_user(fn, args, fns)
+
+
+# Checked in this order when a node has more than one key.
+_EXPR_HANDLERS = {
+    "var": _eval_var,
+    "list": _eval_list,
+    "obj": _eval_obj,
+    "call": _eval_call,
+}
 
 
 def eval_expr(expr: Any, env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> Any:
@@ -45,69 +92,66 @@ def eval_expr(expr: Any, env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) ->
     if not isinstance(expr, dict):
         raise SandboxError(f"Invalid expr node: {expr!r}")
 
-    if "var" in expr:
-        name = expr["var"]
-        if name not in env:
-            raise SandboxError(f"Undefined variable: {name}")
-        return env[name]
+    if len(expr) == 1:
+        handler = _EXPR_HANDLERS.get(next(iter(expr)))
+        if handler is not None:
+            return handler(expr, env, fns)
+    else:
+        for tag, handler in _EXPR_HANDLERS.items():
+            if tag in expr:
+                return handler(expr, env, fns)
 
-    if "list" in expr:
-        return [eval_expr(x, env, fns) for x in expr["list"]]
+    raise SandboxError(f"Unknown expr form: {list(expr.keys())}")
 
-    if "obj" in expr:
-        return {k: eval_expr(v, env, fns) for k, v in expr["obj"].items()}
 
-    if "call" in expr:
-        call = expr["call"]
-        fn = _qual_last(call["fn"])
-        args = [eval_expr(a, env, fns) for a in call.get("args", [])]
-        # builtin
-        if fn in rt.BUILTINS:
-            return rt.call_builtin(fn, args)
-        # user fn
-        if fn not in fns:
-            raise SandboxError(f"Unknown function: {fn}")
-        return call_user(fn, args, fns)
+def _exec_let(stmt: Dict[str, Any], env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> None:
+    spec = stmt["let"]
+    name = spec["name"]
+    env[name] = eval_expr(spec.get("expr"), env, fns)
 
-    raise SandboxError(f"Unknown expr form: {list(expr.keys())}")
 
+def _exec_expr(stmt: Dict[str, Any], env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> None:
+    eval_expr(stmt["expr"], env, fns)
 
-def exec_stmt(stmt: Any, env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> None:
-    if not isinstance(stmt, dict) or len(stmt.keys()) != 1:
-        raise SandboxError(f"Invalid stmt shape: {stmt!r}")
 
-    tag = next(iter(stmt.keys()))
+def _exec_assert(stmt: Dict[str, Any], env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> None:
+    spec = stmt["assert"]
+    ok = eval_expr(spec.get("expr"), env, fns)
+    if not ok:
+        msg = spec.get("message")
+        raise AssertionError(msg or "assert failed")
+
 
-    if tag == "let":
-        spec = stmt["let"]
-        name = spec["name"]
-        env[name] = eval_expr(spec.get("expr"), env, fns)
-        return
+def _exec_return(stmt: Dict[str, Any], env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> None:
+    raise ReturnSignal(eval_expr(stmt["return"], env, fns))
+
+
+def _exec_if(stmt: Dict[str, Any], env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> None:
+    spec = stmt["if"]
+    cond = eval_expr(spec.get("cond"), env, fns)
+    block = spec.get("then", []) if cond else spec.get("else", [])
+    for s in block:
+        exec_stmt(s, env, fns)
 
-    if tag == "expr":
-        eval_expr(stmt["expr"], env, fns)
-        return
 
-    if tag == "assert":
-        spec = stmt["assert"]
-        ok = eval_expr(spec.get("expr"), env, fns)
-        if not ok:
-            msg = spec.get("message")
-            raise AssertionError(msg or "assert failed")
-        return
+_STMT_HANDLERS = {
+    "let": _exec_let,
+    "expr": _exec_expr,
+    "assert": _exec_assert,
+    "return": _exec_return,
+    "if": _exec_if,
+}
 
-    if tag == "return":
-        raise ReturnSignal(eval_expr(stmt["return"], env, fns))
 
-    if tag == "if":
-        spec = stmt["if"]
-        cond = eval_expr(spec.get("cond"), env, fns)
-        block = spec.get("then", []) if cond else spec.get("else", [])
-        for s in block:
-            exec_stmt(s, env, fns)
-        return
+def exec_stmt(stmt: Any, env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> None:
+    if not isinstance(stmt, dict) or len(stmt.keys()) != 1:
+        raise SandboxError(f"Invalid stmt shape: {stmt!r}")
 
-    raise SandboxError(f"Unknown stmt: {tag}")
+    tag = next(iter(stmt.keys()))
+    handler = _STMT_HANDLERS.get(tag)
+    if handler is None:
+        raise SandboxError(f"Unknown stmt: {tag}")
+    handler(stmt, env, fns)
 
 
 def exec_block(stmts: List[Any], env: Dict[str, Any], fns: Dict[str, Dict[str, Any]]) -> Any:
@@ -131,35 +175,431 @@ def call_user(fn_name: str, args: List[Any], fns: Dict[str, Dict[str, Any]]) ->
     return None
 
 
-def run_module(module: Dict[str, Any], fn: str, args: List[Any], allowed_effects: List[str]) -> Any:
-    rt.set_allowed_effects(allowed_effects)
+# -------------------------
+# Compiled execution
+# -------------------------
+#
+# `run_module` does not walk the JSON-AST per evaluation. Each user function is
+# lowered (lazily, on first call) into a flat list of instruction tuples with
+# variables resolved to integer slots and builtins bound to their callables,
+# then executed by a single dispatch loop over an explicit value stack.
+#
+# Malformed nodes are compiled into OP_RAISE so errors still surface only when
+# (and if) the offending node is actually executed, like the tree-walker above.
+
+# Opcodes are small ints compared with `is` (CPython caches small ints).
+OP_LIT = 0            # (OP_LIT, value)
+OP_VAR = 1            # (OP_VAR, slot, name)
+OP_STORE = 2          # (OP_STORE, slot)
+OP_POP = 3            # (OP_POP,)
+OP_LIST = 4           # (OP_LIST, n)
+OP_OBJ = 5            # (OP_OBJ, keys)
+OP_CALL_BUILTIN = 6   # (OP_CALL_BUILTIN, fn, nargs)
+OP_CALL_USER = 7      # (OP_CALL_USER, name, nargs)
+OP_JMP_IF_FALSE = 8   # (OP_JMP_IF_FALSE, target)
+OP_JMP = 9            # (OP_JMP, target)
+OP_RETURN = 10        # (OP_RETURN,)
+OP_ASSERT = 11        # (OP_ASSERT, message)
+OP_RAISE = 12         # (OP_RAISE, message)
+
+_UNSET = object()
+
+
+@dataclass
+class _CompiledFn:
+    name: str
+    code: List[tuple]
+    n_locals: int
+    param_slots: List[int]
+
+
+# Higher-order builtins that only iterate their last (list) argument once.
+_RANGE_CONSUMERS = frozenset(("list_map", "list_filter", "list_reduce"))
+
+
+def _over_range(hof: Any) -> Any:
+    def call(*args: Any) -> Any:
+        return hof(*args[:-1], range(int(args[-1])))
+
+    return call
+
+
+class _Compiler:
+    def __init__(self, builtins: Dict[str, Any]) -> None:
+        self.builtins = builtins
+        self.code: List[tuple] = []
+        self.slots: Dict[str, int] = {}
+
+    def slot(self, name: str) -> int:
+        idx = self.slots.get(name)
+        if idx is None:
+            idx = self.slots[name] = len(self.slots)
+        return idx
+
+    def expr(self, expr: Any) -> None:
+        emit = self.code.append
+        if isinstance(expr, (int, float, str, bool)) or expr is None:
+            emit((OP_LIT, expr))
+            return
+        if not isinstance(expr, dict):
+            emit((OP_RAISE, f"Invalid expr node: {expr!r}"))
+            return
+
+        if "var" in expr:
+            name = expr["var"]
+            if not isinstance(name, str):
+                emit((OP_RAISE, f"Undefined variable: {name}"))
+                return
+            emit((OP_VAR, self.slot(name), name))
+            return
+
+        if "list" in expr:
+            items = expr["list"]
+            if not isinstance(items, list):
+                emit((OP_RAISE, f"Invalid list node: {items!r}"))
+                return
+            for x in items:
+                self.expr(x)
+            emit((OP_LIST, len(items)))
+            return
+
+        if "obj" in expr:
+            obj = expr["obj"]
+            if not isinstance(obj, dict):
+                emit((OP_RAISE, f"Invalid obj node: {obj!r}"))
+                return
+            for v in obj.values():
+                self.expr(v)
+            emit((OP_OBJ, tuple(obj.keys())))
+            return
+
+        if "call" in expr:
+            call = expr["call"]
+            fn = call.get("fn") if isinstance(call, dict) else None
+            args = call.get("args", []) if isinstance(call, dict) else None
+            if not isinstance(fn, str) or not isinstance(args, list):
+                emit((OP_RAISE, f"Invalid call node: {call!r}"))
+                return
+            name = _qual_last(fn)
+            builtin = self.builtins.get(name)
+            if name in _RANGE_CONSUMERS and args and self._is_range_call(args[-1]):
+                # `list_map(f, list_range(n))` etc.: iterate the range directly
+                # instead of materializing the intermediate list
+                for a in args[:-1]:
+                    self.expr(a)
+                self.expr(args[-1]["call"]["args"][0])
+                emit((OP_CALL_BUILTIN, _over_range(builtin), len(args)))
+                return
+            for a in args:
+                self.expr(a)
+            if builtin is not None:
+                emit((OP_CALL_BUILTIN, builtin, len(args)))
+            else:
+                emit((OP_CALL_USER, name, len(args)))
+            return
+
+        emit((OP_RAISE, f"Unknown expr form: {list(expr.keys())}"))
+
+    def _is_range_call(self, expr: Any) -> bool:
+        if not isinstance(expr, dict) or len(expr) != 1 or "call" not in expr:
+            return False
+        call = expr["call"]
+        if not isinstance(call, dict) or not isinstance(call.get("fn"), str):
+            return False
+        args = call.get("args", [])
+        return (
+            isinstance(args, list)
+            and len(args) == 1
+            and _qual_last(call["fn"]) == "list_range"
+            and self.builtins.get("list_range") is rt.list_range
+        )
+
+    def block(self, stmts: Any) -> None:
+        if not isinstance(stmts, list):
+            self.code.append((OP_RAISE, f"Invalid block: {stmts!r}"))
+            return
+        for s in stmts:
+            self.stmt(s)
+
+    def stmt(self, stmt: Any) -> None:
+        code = self.code
+        emit = code.append
+        if not isinstance(stmt, dict) or len(stmt.keys()) != 1:
+            emit((OP_RAISE, f"Invalid stmt shape: {stmt!r}"))
+            return
+
+        tag = next(iter(stmt.keys()))
+        spec = stmt[tag]
+
+        if tag == "let":
+            name = spec.get("name") if isinstance(spec, dict) else None
+            if not isinstance(name, str):
+                emit((OP_RAISE, f"Invalid let: {spec!r}"))
+                return
+            self.expr(spec.get("expr"))
+            emit((OP_STORE, self.slot(name)))
+            return
+
+        if tag == "expr":
+            self.expr(spec)
+            emit((OP_POP,))
+            return
+
+        if tag == "assert":
+            if not isinstance(spec, dict):
+                emit((OP_RAISE, f"Invalid assert: {spec!r}"))
+                return
+            self.expr(spec.get("expr"))
+            emit((OP_ASSERT, spec.get("message")))
+            return
+
+        if tag == "return":
+            self.expr(spec)
+            emit((OP_RETURN,))
+            return
+
+        if tag == "if":
+            if not isinstance(spec, dict):
+                emit((OP_RAISE, f"Invalid if: {spec!r}"))
+                return
+            self.expr(spec.get("cond"))
+            jif = len(code)
+            emit((OP_JMP_IF_FALSE, -1))
+            self.block(spec.get("then", []))
+            els = spec.get("else", [])
+            if els:
+                jmp = len(code)
+                emit((OP_JMP, -1))
+                code[jif] = (OP_JMP_IF_FALSE, len(code))
+                self.block(els)
+                code[jmp] = (OP_JMP, len(code))
+            else:
+                code[jif] = (OP_JMP_IF_FALSE, len(code))
+            return
+
+        emit((OP_RAISE, f"Unknown stmt: {tag}"))
+
+
+def _compile_fn(fn: Dict[str, Any], builtins: Optional[Dict[str, Any]] = None) -> _CompiledFn:
+    """Lower one function body to a flat instruction list (see OP_* above)."""
+    c = _Compiler(rt.BUILTINS if builtins is None else builtins)
+    params = fn.get("params", []) or []
+    param_slots = [c.slot(p) for p in params]
+    c.block(fn.get("body", []) or [])
+    return _CompiledFn(fn.get("name", "<anon>"), c.code, len(c.slots), param_slots)
+
+
+class _Program:
+    """Compiled view of a module's functions; compiles each function on first call."""
+
+    def __init__(self, fns: Dict[str, Dict[str, Any]], *, jit: bool = False) -> None:
+        self.fns = fns
+        self.compiled: Dict[str, _CompiledFn] = {}
+        self.builtins: Dict[str, Any] = rt.BUILTINS
+        self.mappers: Dict[str, Any] = {}
+        if jit and jit_cache.available():
+            self.builtins = dict(rt.BUILTINS)
+            self.builtins["list_map"] = self._list_map_jit
+
+    def _list_map_jit(self, fn: Any, xs: Any) -> Any:
+        name = _qual_last(fn) if isinstance(fn, str) else None
+        if name is not None and name not in rt.BUILTINS and name in self.fns:
+            if name not in self.mappers:
+                self.mappers[name] = jit_cache.compile_mapper(self.fns[name])
+            mapper = self.mappers[name]
+            if mapper is not None:
+                out = jit_cache.map_floats(mapper, xs)
+                if out is not None:
+                    return out
+        return rt.list_map(fn, xs)
+
+    def call(self, fn_name: str, args: List[Any]) -> Any:
+        cfn = self.compiled.get(fn_name)
+        if cfn is None:
+            fn = self.fns.get(fn_name)
+            if fn is None:
+                raise SandboxError(f"Unknown function: {fn_name}")
+            cfn = self.compiled[fn_name] = _compile_fn(fn, self.builtins)
+        if len(cfn.param_slots) != len(args):
+            raise SandboxError(f"Arity mismatch calling {fn_name}: expected {len(cfn.param_slots)} got {len(args)}")
+        return _execute(cfn, args, self)
+
+
+def compile_expr(expr: Any) -> _CompiledFn:
+    """Lower a closed expression (no variables in scope) to an instruction list."""
+    c = _Compiler(rt.BUILTINS)
+    c.expr(expr)
+    c.code.append((OP_RETURN,))
+    return _CompiledFn("<expr>", c.code, len(c.slots), [])
+
+
+class ExprEvaluator:
+    """Evaluate closed expressions against one module's functions.
+
+    Equivalent to `eval_expr(expr, {}, fns)`, but runs on the compiled path and
+    shares one program across calls, so each user function body called from
+    the expressions is lowered at most once.
+    """
+
+    def __init__(self, fns: Dict[str, Dict[str, Any]]) -> None:
+        self._prog = _Program(fns)
+
+    def __call__(self, expr: Any) -> Any:
+        return _execute(compile_expr(expr), [], self._prog)
+
+
+def _execute(cfn: _CompiledFn, args: List[Any], prog: _Program) -> Any:
+    slots: List[Any] = [_UNSET] * cfn.n_locals
+    for idx, a in zip(cfn.param_slots, args):
+        slots[idx] = a
+
+    code = cfn.code
+    n = len(code)
+    stack: List[Any] = []
+    push = stack.append
+    pop = stack.pop
+    pc = 0
+    while pc < n:
+        ins = code[pc]
+        op = ins[0]
+        pc += 1
+        if op is OP_CALL_BUILTIN:
+            # most builtins take one or two args: call them without building a list
+            nargs = ins[2]
+            if nargs == 2:
+                b = pop()
+                stack[-1] = ins[1](stack[-1], b)
+            elif nargs == 1:
+                stack[-1] = ins[1](stack[-1])
+            elif nargs:
+                cargs = stack[-nargs:]
+                del stack[-nargs:]
+                push(ins[1](*cargs))
+            else:
+                push(ins[1]())
+        elif op is OP_VAR:
+            v = slots[ins[1]]
+            if v is _UNSET:
+                raise SandboxError(f"Undefined variable: {ins[2]}")
+            push(v)
+        elif op is OP_LIT:
+            push(ins[1])
+        elif op is OP_STORE:
+            slots[ins[1]] = pop()
+        elif op is OP_CALL_USER:
+            nargs = ins[2]
+            if nargs:
+                cargs = stack[-nargs:]
+                del stack[-nargs:]
+            else:
+                cargs = []
+            push(prog.call(ins[1], cargs))
+        elif op is OP_JMP_IF_FALSE:
+            if not pop():
+                pc = ins[1]
+        elif op is OP_JMP:
+            pc = ins[1]
+        elif op is OP_RETURN:
+            return pop()
+        elif op is OP_POP:
+            pop()
+        elif op is OP_LIST:
+            cnt = ins[1]
+            if cnt:
+                items = stack[-cnt:]
+                del stack[-cnt:]
+            else:
+                items = []
+            push(items)
+        elif op is OP_OBJ:
+            keys = ins[1]
+            cnt = len(keys)
+            if cnt:
+                vals = stack[-cnt:]
+                del stack[-cnt:]
+            else:
+                vals = []
+            push(dict(zip(keys, vals)))
+        elif op is OP_ASSERT:
+            if not pop():
+                raise AssertionError(ins[1] or "assert failed")
+        elif op is OP_RAISE:
+            raise SandboxError(ins[1])
+        else:  # pragma: no cover
+            raise SandboxError(f"Bad opcode: {op!r}")
+    # if fell through, return None
+    return None
+
+
+class PreparedModule:
+    """A module indexed and lowered once, for running many calls against it.
+
+    Function bodies are compiled on first use and reused by later calls, so the
+    module must not be modified while a `PreparedModule` for it is in use.
+    """
 
-    # index functions by name (unqualified)
-    fns: Dict[str, Dict[str, Any]] = {}
-    for f in module.get("functions", []) or []:
-        if isinstance(f, dict) and isinstance(f.get("name"), str):
-            fns[f["name"]] = f
+    def __init__(self, module: Dict[str, Any], *, jit: bool = False) -> None:
+        # index functions by name (unqualified)
+        fns: Dict[str, Dict[str, Any]] = {}
+        for f in module.get("functions", []) or []:
+            if isinstance(f, dict) and isinstance(f.get("name"), str):
+                fns[sys.intern(f["name"])] = f
+        self.fns = fns
+        self._prog = _Program(fns, jit=jit)
 
-    # Install a dispatcher so higher-order builtins (list_map/list_filter/list_reduce)
-    # can call user-defined functions by name.
-    def _dispatch(fn_name: str, dargs: List[Any]) -> Any:
+    def _dispatch(self, fn_name: str, dargs: List[Any]) -> Any:
         name = _qual_last(fn_name)
-        if name in rt.BUILTINS:
-            return rt.call_builtin(name, dargs)
-        if name not in fns:
+        builtin = rt.BUILTINS.get(name)
+        if builtin is not None:
+            return builtin(*dargs)
+        if name not in self.fns:
             raise SandboxError(f"Unknown function: {fn_name}")
-        return call_user(name, dargs, fns)
+        return self._prog.call(name, dargs)
 
-    rt.set_dispatch(_dispatch)
+    def run(self, fn: str, args: List[Any], allowed_effects: List[str]) -> Any:
+        """Same contract as `run_module`."""
+        rt.set_allowed_effects(allowed_effects)
 
-    fn_last = _qual_last(fn)
-    if fn_last not in fns and fn_last not in rt.BUILTINS:
-        raise SandboxError(f"Unknown function: {fn}")
+        # Install a dispatcher so higher-order builtins (list_map/list_filter/list_reduce)
+        # can call user-defined functions by name.
+        rt.set_dispatch(self._dispatch)
+
+        fn_last = _qual_last(fn)
+        if fn_last not in self.fns and fn_last not in rt.BUILTINS:
+            raise SandboxError(f"Unknown function: {fn}")
+
+        if fn_last in rt.BUILTINS:
+            return rt.call_builtin(fn_last, args)
+
+        return self._prog.call(fn_last, args)
+
+    def __getitem__(self, fn: str) -> Callable[[List[Any], List[str]], Any]:
+        return functools.partial(self.run, fn)
+
+
+def prepare_module(module: Dict[str, Any], *, jit: bool = False) -> PreparedModule:
+    return PreparedModule(module, jit=jit)
+
+
+def run_module(module: Dict[str, Any], fn: str, args: List[Any], allowed_effects: List[str], *, jit: bool = False) -> Any:
+    """Run `fn` from `module` with positional `args` under the given effect allowlist.
+
+    `jit=True` opts into the Numba fast path for `list_map` over float lists
+    (see `jit_cache`); it is a no-op when numba is not installed. Use
+    `prepare_module` to run many calls against the same module.
+    """
+    return PreparedModule(module, jit=jit).run(fn, args, allowed_effects)
+
+
+def run_module_fast(module: Dict[str, Any], fn: str, args: List[Any], allowed_effects: List[str]) -> Any:
+    """Run `fn` via the Python codegen sandbox (`sandbox_exec_py`) instead of interpreting.
 
-    if fn_last in rt.BUILTINS:
-        return rt.call_builtin(fn_last, args)
+    Faster for hot or repeated runs (compiled module code is cached), but it
+    executes generated Python; use `run_module` when that is not acceptable.
+    """
+    from astra.tools.sandbox_exec_py import run_python_sandbox  # imports this module
 
-    return call_user(fn_last, args, fns)
+    return run_python_sandbox(module, fn, args, allowed_effects)
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -168,10 +608,11 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument("--fn", required=True, help="Function name")
     ap.add_argument("--args", nargs="*", default=[], help="Positional args (JSON literals)")
     ap.add_argument("--allowed", nargs="*", default=["pure"], help="Allowed effects")
+    ap.add_argument("--jit", action="store_true", help="Use numba for list_map over float lists (if installed)")
     args = ap.parse_args(argv)
 
     try:
-        module = json.loads(Path(args.path).read_text(encoding="utf-8"))
+        module = canonicalize_module(_json.load_path(args.path))
     except Exception as e:
         print(f"Failed to read/parse JSON: {e}", file=sys.stderr)
         return 3
@@ -185,7 +626,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             parsed_args.append(a)
 
     try:
-        out = run_module(module, args.fn, parsed_args, args.allowed)
+        out = run_module(module, args.fn, parsed_args, args.allowed, jit=args.jit)
     except Exception as e:
         print(f"error: {e}", file=sys.stderr)
         return 2
@@ -15,11 +15,14 @@ it provides a practical execution path.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import sys
-from pathlib import Path
+import types
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
+from astra.tools import _json
 from astra.tools import runtime_guarded as rt
 from astra.tools.codegen_py import generate_python
 from astra.tools.sandbox_ast import run_module as run_ast  # for fallback
@@ -29,30 +32,51 @@ def _qual_last(name: str) -> str:
     return name.rsplit(".", 1)[-1]
 
 
-def run_python_sandbox(module: Dict[str, Any], fn: str, args: List[Any], allowed_effects: List[str]) -> Any:
-    rt.set_allowed_effects(allowed_effects)
+# Very restricted builtins
+_SAFE_BUILTINS: Dict[str, Any] = {
+    "True": True,
+    "False": False,
+    "None": None,
+    "list": list,
+    "globals": globals,
+    "AssertionError": AssertionError,
+    "NameError": NameError,
+    "TypeError": TypeError,
+    "ValueError": ValueError,
+}
+
+# Compiled module code, keyed by a digest of the canonical module JSON (LRU).
+_CODE_CACHE_MAX = 64
+_CODE_CACHE: "OrderedDict[str, types.CodeType]" = OrderedDict()
+
+
+def _module_code(module: Dict[str, Any]) -> types.CodeType:
+    text = json.dumps(module, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    code_obj = _CODE_CACHE.get(key)
+    if code_obj is not None:
+        _CODE_CACHE.move_to_end(key)
+        return code_obj
 
     code = generate_python(module, standalone=False)
+    code_obj = compile(code, "<astra>", "exec")
+    _CODE_CACHE[key] = code_obj
+    if len(_CODE_CACHE) > _CODE_CACHE_MAX:
+        _CODE_CACHE.popitem(last=False)
+    return code_obj
 
-    # Very restricted builtins
-    safe_builtins: Dict[str, Any] = {
-        "True": True,
-        "False": False,
-        "None": None,
-        "list": list,
-        "globals": globals,
-        "AssertionError": AssertionError,
-        "NameError": NameError,
-        "TypeError": TypeError,
-        "ValueError": ValueError,
-    }
+
+def run_python_sandbox(module: Dict[str, Any], fn: str, args: List[Any], allowed_effects: List[str]) -> Any:
+    rt.set_allowed_effects(allowed_effects)
+
+    code_obj = _module_code(module)
 
     g: Dict[str, Any] = {
-        "__builtins__": safe_builtins,
+        "__builtins__": _SAFE_BUILTINS,
         "rt": rt,
     }
 
-    exec(compile(code, "<astra>", "exec"), g, g)
+    exec(code_obj, g, g)
 
     fn_last = _qual_last(fn)
     if fn_last in rt.BUILTINS:
@@ -74,7 +98,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     args_ns = ap.parse_args(argv)
 
     try:
-        module = json.loads(Path(args_ns.path).read_text(encoding="utf-8"))
+        module = _json.load_path(args_ns.path)
     except Exception as e:
         print(f"Failed to read/parse JSON: {e}", file=sys.stderr)
         return 3
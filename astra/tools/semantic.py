@@ -14,17 +14,20 @@ This checker intentionally does NOT do deep type inference. Use `astra typecheck
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
+from astra.tools import _json
 from astra.tools.pointer import join_pointer
 
 
+# Call sites repeat the same few names, so memoize (and intern) the split.
+@functools.lru_cache(maxsize=2048)
 def _qual_last(name: str) -> str:
-    return name.rsplit(".", 1)[-1]
+    return sys.intern(name.rsplit(".", 1)[-1])
 
 # Builtin arities (must match runtime + typechecker)
 BUILTIN_ARITY: Dict[str, int] = {
@@ -76,6 +79,11 @@ BUILTIN_ARITY: Dict[str, int] = {
 
 RESERVED_NAMES = {"result"}
 
+_EXPR_TAGS = ("var", "call", "list", "obj")
+
+# Higher-order builtins -> arity expected of the referenced function
+_HO_ARITIES: Dict[str, int] = {"list_map": 1, "list_filter": 1, "list_reduce": 2}
+
 
 @dataclass(frozen=True)
 class Issue:
@@ -95,8 +103,15 @@ class Issue:
 
 @dataclass(frozen=True)
 class Flow:
-    definite: Set[str]
-    maybe: Set[str]
+    # Immutable, so a flow is shared until a `let` actually adds a name.
+    __slots__ = ("definite", "maybe")
+
+    definite: FrozenSet[str]
+    maybe: FrozenSet[str]
+
+    def __reduce__(self) -> Any:
+        # frozen slotted instances can't be restored attribute by attribute
+        return (Flow, (self.definite, self.maybe))
 
 
 def _collect_user_arities(module: Dict[str, Any]) -> Dict[str, int]:
@@ -107,7 +122,7 @@ def _collect_user_arities(module: Dict[str, Any]) -> Dict[str, int]:
         name = fn.get("name")
         params = fn.get("params", []) or []
         if isinstance(name, str) and isinstance(params, list):
-            out[name] = len([p for p in params if isinstance(p, str)])
+            out[sys.intern(name)] = len([p for p in params if isinstance(p, str)])
     return out
 
 
@@ -118,8 +133,14 @@ def _analyze_expr(expr: Any, ptr: List[Any], flow: Flow, issues: List[Issue], kn
         issues.append(Issue(join_pointer(ptr), "InvalidExpr", f"Expression must be literal or object, got {type(expr).__name__}"))
         return
 
-    if "var" in expr:
-        name = expr.get("var")
+    if len(expr) == 1:
+        tag = next(iter(expr))
+    else:
+        # malformed multi-key node: keep the historical var/call/list/obj priority
+        tag = next((t for t in _EXPR_TAGS if t in expr), None)
+
+    if tag == "var":
+        name = expr["var"]
         if not isinstance(name, str):
             issues.append(Issue(join_pointer(ptr + ["var"]), "InvalidVarRef", "var must be a string"))
             return
@@ -127,8 +148,8 @@ def _analyze_expr(expr: Any, ptr: List[Any], flow: Flow, issues: List[Issue], kn
             issues.append(Issue(join_pointer(ptr + ["var"]), "UndefinedVariable", f"Undefined variable: {name}"))
         return
 
-    if "call" in expr:
-        call = expr.get("call")
+    if tag == "call":
+        call = expr["call"]
         if not isinstance(call, dict):
             issues.append(Issue(join_pointer(ptr + ["call"]), "InvalidCall", "call must be an object"))
             return
@@ -143,25 +164,22 @@ def _analyze_expr(expr: Any, ptr: List[Any], flow: Flow, issues: List[Issue], kn
 
         # name/arity checks
         fn_last = _qual_last(fn)
-        if fn_last not in known_arities:
+        expected = known_arities.get(fn_last)
+        if expected is None:
             issues.append(Issue(join_pointer(ptr + ["call", "fn"]), "UnknownFunctionCall", f"Unknown function: {fn}"))
-        else:
-            expected = known_arities[fn_last]
-            if expected != len(args):
-                issues.append(Issue(join_pointer(ptr + ["call"]), "ArityMismatch", f"{fn} expects {expected} args but got {len(args)}"))
+        elif expected != len(args):
+            issues.append(Issue(join_pointer(ptr + ["call"]), "ArityMismatch", f"{fn} expects {expected} args but got {len(args)}"))
 
         # higher-order builtins: validate referenced function name/arity when it's a string literal
-        if fn_last in {"list_map", "list_filter", "list_reduce"} and args:
+        want = _HO_ARITIES.get(fn_last)
+        if want is not None and args:
             ref = args[0]
             if isinstance(ref, str):
-                ref_last = _qual_last(ref)
-                if ref_last not in known_arities:
+                got = known_arities.get(_qual_last(ref))
+                if got is None:
                     issues.append(Issue(join_pointer(ptr + ["call", "args", 0]), "UnknownFunctionRef", f"Unknown function reference: {ref}"))
-                else:
-                    want = 1 if fn_last in {"list_map", "list_filter"} else 2
-                    got = known_arities[ref_last]
-                    if got != want:
-                        issues.append(Issue(join_pointer(ptr + ["call", "args", 0]), "ArityMismatch", f"{fn_last} expects '{ref}' to have arity {want} but it has {got}"))
+                elif got != want:
+                    issues.append(Issue(join_pointer(ptr + ["call", "args", 0]), "ArityMismatch", f"{fn_last} expects '{ref}' to have arity {want} but it has {got}"))
             else:
                 issues.append(Issue(join_pointer(ptr + ["call", "args", 0]), "InvalidFunctionRef", f"{fn_last} expects first arg to be a string function name"))
 
@@ -169,8 +187,8 @@ def _analyze_expr(expr: Any, ptr: List[Any], flow: Flow, issues: List[Issue], kn
             _analyze_expr(a, ptr + ["call", "args", i], flow, issues, known_arities)
         return
 
-    if "list" in expr:
-        arr = expr.get("list")
+    if tag == "list":
+        arr = expr["list"]
         if not isinstance(arr, list):
             issues.append(Issue(join_pointer(ptr + ["list"]), "InvalidList", "list must be an array"))
             return
@@ -178,8 +196,8 @@ def _analyze_expr(expr: Any, ptr: List[Any], flow: Flow, issues: List[Issue], kn
             _analyze_expr(a, ptr + ["list", i], flow, issues, known_arities)
         return
 
-    if "obj" in expr:
-        obj = expr.get("obj")
+    if tag == "obj":
+        obj = expr["obj"]
         if not isinstance(obj, dict):
             issues.append(Issue(join_pointer(ptr + ["obj"]), "InvalidObj", "obj must be an object"))
             return
@@ -190,21 +208,94 @@ def _analyze_expr(expr: Any, ptr: List[Any], flow: Flow, issues: List[Issue], kn
     issues.append(Issue(join_pointer(ptr), "UnknownExpr", f"Unknown expr form: {list(expr.keys())}"))
 
 
-def _analyze_block(stmts: List[Any], ptr: List[Any], flow_in: Flow, issues: List[Issue], known_arities: Dict[str, int]) -> Tuple[Flow, bool]:
-    flow = Flow(set(flow_in.definite), set(flow_in.maybe))
-    terminated = False
+class _BlockFrame:
+    """One statement list being walked by `_analyze_block`."""
+
+    __slots__ = ("stmts", "ptr", "idx", "flow", "terminated", "join")
+
+    def __init__(self, stmts: List[Any], ptr: List[Any], flow: Flow, join: Optional["_IfJoin"]) -> None:
+        self.stmts = stmts
+        self.ptr = ptr
+        self.idx = 0
+        self.flow = flow
+        self.terminated = False
+        self.join = join
+
+
+class _IfJoin:
+    """Pending `if`: holds the then-branch result until the else-branch finishes."""
+
+    __slots__ = ("spec", "ptr", "flow_in", "then_result")
+
+    def __init__(self, spec: Dict[str, Any], ptr: List[Any], flow_in: Flow) -> None:
+        self.spec = spec
+        self.ptr = ptr
+        self.flow_in = flow_in
+        self.then_result: Optional[Tuple[Flow, bool]] = None
+
+
+def _enter_if(stmt: Dict[str, Any], ptr: List[Any], flow_in: Flow, issues: List[Issue], known_arities: Dict[str, int]) -> Optional[_IfJoin]:
+    spec = stmt["if"]
+    if not isinstance(spec, dict):
+        issues.append(Issue(join_pointer(ptr + ["if"]), "InvalidIf", "if must be an object"))
+        return None
 
-    for i, stmt in enumerate(stmts):
-        stmt_ptr = ptr + [i]
-        if terminated:
-            issues.append(Issue(join_pointer(stmt_ptr), "UnreachableStatement", "Statement is unreachable (previous statement always returns).", "warning"))
+    _analyze_expr(spec.get("cond"), ptr + ["if", "cond"], flow_in, issues, known_arities)
+
+    then = spec.get("then", [])
+    els = spec.get("else", [])
+    if not isinstance(then, list) or not isinstance(els, list):
+        issues.append(Issue(join_pointer(ptr + ["if"]), "InvalidIf", "if.then and if.else must be arrays"))
+        return None
+    return _IfJoin(spec, ptr, flow_in)
+
+
+def _analyze_block(stmts: List[Any], ptr: List[Any], flow_in: Flow, issues: List[Issue], known_arities: Dict[str, int]) -> Tuple[Flow, bool]:
+    """Analyze a statement list.
+
+    Nested if-blocks are walked with an explicit stack rather than recursion, so
+    deeply nested modules do not hit the interpreter's recursion limit.
+    """
+    stack = [_BlockFrame(stmts, ptr, flow_in, None)]
+
+    while True:
+        frame = stack[-1]
+        if frame.idx < len(frame.stmts):
+            i = frame.idx
+            frame.idx = i + 1
+            stmt_ptr = frame.ptr + [i]
+            if frame.terminated:
+                issues.append(Issue(join_pointer(stmt_ptr), "UnreachableStatement", "Statement is unreachable (previous statement always returns).", "warning"))
+                continue
+
+            stmt = frame.stmts[i]
+            if isinstance(stmt, dict) and len(stmt) == 1 and "if" in stmt:
+                join = _enter_if(stmt, stmt_ptr, frame.flow, issues, known_arities)
+                if join is not None:
+                    stack.append(_BlockFrame(join.spec.get("then", []), stmt_ptr + ["if", "then"], frame.flow, join))
+                continue
+
+            frame.flow, always_returns = _analyze_stmt(stmt, stmt_ptr, frame.flow, issues, known_arities)
+            if always_returns:
+                frame.terminated = True
             continue
 
-        flow, always_returns = _analyze_stmt(stmt, stmt_ptr, flow, issues, known_arities)
-        if always_returns:
-            terminated = True
+        # block finished
+        stack.pop()
+        join = frame.join
+        if join is None:
+            return frame.flow, frame.terminated
 
-    return flow, terminated
+        if join.then_result is None:
+            join.then_result = (frame.flow, frame.terminated)
+            stack.append(_BlockFrame(join.spec.get("else", []), join.ptr + ["if", "else"], join.flow_in, join))
+            continue
+
+        flow_then, ret_then = join.then_result
+        parent = stack[-1]
+        parent.flow = Flow(flow_then.definite & frame.flow.definite, flow_then.maybe | frame.flow.maybe)
+        if ret_then and frame.terminated:
+            parent.terminated = True
 
 
 def _analyze_stmt(stmt: Any, ptr: List[Any], flow_in: Flow, issues: List[Issue], known_arities: Dict[str, int]) -> Tuple[Flow, bool]:
@@ -233,11 +324,8 @@ def _analyze_stmt(stmt: Any, ptr: List[Any], flow_in: Flow, issues: List[Issue],
 
         _analyze_expr(spec.get("expr"), ptr + ["let", "expr"], flow_in, issues, known_arities)
 
-        new_def = set(flow_in.definite)
-        new_maybe = set(flow_in.maybe)
-        new_def.add(name)
-        new_maybe.add(name)
-        return Flow(new_def, new_maybe), False
+        name_set = frozenset((name,))
+        return Flow(flow_in.definite | name_set, flow_in.maybe | name_set), False
 
     if tag == "expr":
         _analyze_expr(stmt["expr"], ptr + ["expr"], flow_in, issues, known_arities)
@@ -255,27 +343,6 @@ def _analyze_stmt(stmt: Any, ptr: List[Any], flow_in: Flow, issues: List[Issue],
         _analyze_expr(stmt["return"], ptr + ["return"], flow_in, issues, known_arities)
         return flow_in, True
 
-    if tag == "if":
-        spec = stmt["if"]
-        if not isinstance(spec, dict):
-            issues.append(Issue(join_pointer(ptr + ["if"]), "InvalidIf", "if must be an object"))
-            return flow_in, False
-
-        _analyze_expr(spec.get("cond"), ptr + ["if", "cond"], flow_in, issues, known_arities)
-
-        then = spec.get("then", [])
-        els = spec.get("else", [])
-        if not isinstance(then, list) or not isinstance(els, list):
-            issues.append(Issue(join_pointer(ptr + ["if"]), "InvalidIf", "if.then and if.else must be arrays"))
-            return flow_in, False
-
-        flow_then, ret_then = _analyze_block(then, ptr + ["if", "then"], flow_in, issues, known_arities)
-        flow_else, ret_else = _analyze_block(els, ptr + ["if", "else"], flow_in, issues, known_arities)
-
-        definite = flow_then.definite & flow_else.definite
-        maybe = flow_then.maybe | flow_else.maybe
-        return Flow(definite, maybe), (ret_then and ret_else)
-
     issues.append(Issue(join_pointer(ptr), "UnknownStmt", f"Unknown statement form: {tag}"))
     return flow_in, False
 
@@ -284,8 +351,7 @@ def check_module(module: Dict[str, Any]) -> List[Dict[str, Any]]:
     issues: List[Issue] = []
 
     user_arities = _collect_user_arities(module)
-    known_arities = dict(BUILTIN_ARITY)
-    known_arities.update(user_arities)
+    known_arities = {**BUILTIN_ARITY, **user_arities}
 
     for fi, fn in enumerate(module.get("functions", []) or []):
         if not isinstance(fn, dict):
@@ -300,7 +366,8 @@ def check_module(module: Dict[str, Any]) -> List[Dict[str, Any]]:
             if p in RESERVED_NAMES:
                 issues.append(Issue(join_pointer(["functions", fi, "params", pi]), "ReservedName", f"'{p}' is reserved"))
 
-        flow0 = Flow(definite=set([p for p in params if isinstance(p, str)]), maybe=set([p for p in params if isinstance(p, str)]))
+        param_names = frozenset(sys.intern(p) for p in params if isinstance(p, str))
+        flow0 = Flow(definite=param_names, maybe=param_names)
         body = fn.get("body", []) or []
         if not isinstance(body, list):
             issues.append(Issue(join_pointer(["functions", fi, "body"]), "InvalidBody", "body must be an array"))
@@ -320,7 +387,7 @@ def main(argv: List[str] | None = None) -> int:
     args = ap.parse_args(argv)
 
     try:
-        module = json.loads(Path(args.path).read_text(encoding="utf-8"))
+        module = _json.load_path(args.path)
     except Exception as e:
         print(f"Failed to read/parse JSON: {e}", file=sys.stderr)
         return 3
@@ -8,7 +8,7 @@ Each test case:
 - evaluates `args` expressions
 - runs the function
 - evaluates `expect` expression
-- compares with Python `==`
+- compares with Python `==` semantics
 
 Test execution uses the AST sandbox (`sandbox_ast`) so effects are enforced.
 """
@@ -16,22 +16,30 @@ Test execution uses the AST sandbox (`sandbox_ast`) so effects are enforced.
 from __future__ import annotations
 
 import argparse
-import json
+import concurrent.futures
+import functools
 import sys
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from astra.tools import sandbox_ast
+from astra.tools import _json, sandbox_ast
+from astra.tools.ast_utils import canonicalize_module
 
 
+# Kept for API compatibility; the runner builds the `to_dict()` shape directly.
 @dataclass(frozen=True)
 class TestFailure:
+    __slots__ = ("pointer", "code", "message", "detail")
+
     pointer: str
     code: str
     message: str
     detail: Dict[str, Any]
 
+    def __reduce__(self) -> Any:
+        # frozen slotted instances can't be restored attribute by attribute
+        return (TestFailure, (self.pointer, self.code, self.message, self.detail))
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "pointer": self.pointer,
@@ -42,6 +50,11 @@ class TestFailure:
         }
 
 
+_LITERAL_TYPES = (int, float, str, bool)
+
+_MISSING = object()
+
+
 def _index_fns(module: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     out: Dict[str, Dict[str, Any]] = {}
     for f in module.get("functions", []) or []:
@@ -50,24 +63,103 @@ def _index_fns(module: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     return out
 
 
-def _eval(expr: Any, module: Dict[str, Any]) -> Any:
+def _freeze(v: Any) -> Any:
+    """Hashable key for a JSON value that never conflates distinct values.
+
+    Types are kept (so `1`, `1.0` and `True` differ) and floats are keyed by
+    their exact hex form (so `0.0` and `-0.0` differ).
+    """
+    t = type(v)
+    if t is list:
+        return (list, tuple(_freeze(x) for x in v))
+    if t is dict:
+        return (dict, tuple((k, _freeze(x)) for k, x in v.items()))
+    if t is float:
+        return (float, v.hex())
+    return (t, v)
+
+
+def _fast_eq(a: Any, b: Any) -> bool:
+    """`a == b`, rejecting mismatched top-level containers before any deep compare.
+
+    Only shortcuts that give the same answer as `==` are taken: numbers of
+    different types still compare by value (`1 == 1.0`), so the type check is
+    limited to lists and dicts.
+    """
+    t = type(a)
+    if (t is list or t is dict) and type(b) is t:
+        if a is b:
+            return True
+        if len(a) != len(b):
+            return False
+        # `==` on dicts compares values key by key and can walk large values
+        # before reaching a missing key
+        if t is dict and a.keys() != b.keys():
+            return False
+    return a == b
+
+
+def _eval(
+    expr: Any,
+    module: Dict[str, Any],
+    fns: Optional[Dict[str, Dict[str, Any]]] = None,
+    evaluator: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    # test inputs are usually plain literals: nothing to evaluate
+    if expr is None or type(expr) in _LITERAL_TYPES:
+        return expr
+    if evaluator is not None:
+        return evaluator(expr)
     # evaluate expr in empty env (no vars)
-    fns = _index_fns(module)
+    if fns is None:
+        fns = _index_fns(module)
     return sandbox_ast.eval_expr(expr, {}, fns)
 
 
-def run_testcase(module: Dict[str, Any], fn_name: str, args_exprs: List[Any], expect_expr: Any, allowed_effects: List[str]) -> Tuple[bool, Any, Any, Optional[str]]:
+def run_testcase(
+    module: Dict[str, Any],
+    fn_name: str,
+    args_exprs: List[Any],
+    expect_expr: Any,
+    allowed_effects: List[str],
+    *,
+    fns: Optional[Dict[str, Dict[str, Any]]] = None,
+    evaluator: Optional[Callable[[Any], Any]] = None,
+    call_cache: Optional[Dict[Any, Any]] = None,
+    prepared: Optional[sandbox_ast.PreparedModule] = None,
+) -> Tuple[bool, Any, Any, Optional[str]]:
+    """Run one test case.
+
+    `fns` (from `_index_fns`) and a shared `sandbox_ast.ExprEvaluator` can be
+    passed to avoid re-indexing the module and re-lowering functions per case.
+    `call_cache` memoizes successful calls by `(fn_name, args)`; only pass one
+    when the allowed effects are pure. `prepared` (from
+    `sandbox_ast.prepare_module`) reuses compiled function bodies across calls.
+    """
+    run = prepared.run if prepared is not None else functools.partial(sandbox_ast.run_module, module)
     try:
-        args = [_eval(a, module) for a in args_exprs]
-        expected = _eval(expect_expr, module)
-        actual = sandbox_ast.run_module(module, fn_name, args, allowed_effects)
-        return (actual == expected), actual, expected, None
+        args = [_eval(a, module, fns, evaluator) for a in args_exprs]
+        expected = _eval(expect_expr, module, fns, evaluator)
+        if call_cache is None:
+            actual = run(fn_name, args, allowed_effects)
+        else:
+            key = (fn_name, _freeze(args))
+            actual = call_cache.get(key, _MISSING)
+            if actual is _MISSING:
+                actual = call_cache[key] = run(fn_name, args, allowed_effects)
     except Exception as e:
+        # only the message is reported; no traceback is formatted
         return False, None, None, str(e)
+    return _fast_eq(actual, expected), actual, expected, None
+
 
+# (pointer prefix, message prefix, test index, fn name, args exprs, expect expr, label)
+_Case = Tuple[str, str, int, str, List[Any], Any, Any]
 
-def run_tests(module: Dict[str, Any], allowed_effects: List[str]) -> List[Dict[str, Any]]:
-    failures: List[TestFailure] = []
+
+def _collect_cases(module: Dict[str, Any]) -> List[_Case]:
+    """Validate test-case shapes once; malformed entries are skipped."""
+    cases: List[_Case] = []
 
     # module-level tests
     for ti, tc in enumerate(module.get("tests", []) or []):
@@ -75,44 +167,122 @@ def run_tests(module: Dict[str, Any], allowed_effects: List[str]) -> List[Dict[s
             continue
         fn = tc.get("fn")
         args = tc.get("args", []) or []
-        exp = tc.get("expect")
         if not isinstance(fn, str) or not isinstance(args, list):
             continue
-        ok, actual, expected, err = run_testcase(module, fn, args, exp, allowed_effects)
-        if not ok:
-            failures.append(
-                TestFailure(
-                    pointer=f"/tests/{ti}",
-                    code="TestFailed" if err is None else "TestError",
-                    message=f"Test {tc.get('name') or ti} failed for {fn}",
-                    detail={"expected": expected, "actual": actual, "error": err},
-                )
-            )
+        cases.append(("/tests/", "Test", ti, fn, args, tc.get("expect"), tc.get("name") or ti))
 
     # function-level tests
     for fi, fn in enumerate(module.get("functions", []) or []):
         if not isinstance(fn, dict) or not isinstance(fn.get("name"), str):
             continue
         name = fn["name"]
+        prefix = f"/functions/{fi}/tests/"
         for ti, tc in enumerate(fn.get("tests", []) or []):
             if not isinstance(tc, dict):
                 continue
             args = tc.get("args", []) or []
-            exp = tc.get("expect")
             if not isinstance(args, list):
                 continue
-            ok, actual, expected, err = run_testcase(module, name, args, exp, allowed_effects)
-            if not ok:
-                failures.append(
-                    TestFailure(
-                        pointer=f"/functions/{fi}/tests/{ti}",
-                        code="TestFailed" if err is None else "TestError",
-                        message=f"Function test {tc.get('name') or ti} failed for {name}",
-                        detail={"expected": expected, "actual": actual, "error": err},
-                    )
-                )
+            cases.append((prefix, "Function test", ti, name, args, tc.get("expect"), tc.get("name") or ti))
+
+    return cases
+
+
+def _failure(prefix: str, what: str, ti: int, fn: str, label: Any, result: Tuple[bool, Any, Any, Optional[str]]) -> Dict[str, Any]:
+    _, actual, expected, err = result
+    return {
+        "pointer": prefix + str(ti),
+        "code": "TestFailed" if err is None else "TestError",
+        "severity": "error",
+        "message": f"{what} {label} failed for {fn}",
+        "detail": {"expected": expected, "actual": actual, "error": err},
+    }
+
+
+def _shared_eval(evaluate: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Evaluate structurally identical expressions once (pure runs only)."""
+    cache: Dict[Any, Any] = {}
+
+    def run(expr: Any) -> Any:
+        key = _freeze(expr)
+        v = cache.get(key, _MISSING)
+        if v is _MISSING:
+            v = cache[key] = evaluate(expr)
+        return v
 
-    return [f.to_dict() for f in failures]
+    return run
+
+
+class _Runner:
+    """Per-module state shared by every test case of one run (or one worker)."""
+
+    def __init__(self, module: Dict[str, Any], allowed_effects: List[str]) -> None:
+        self.module = module
+        self.allowed_effects = allowed_effects
+        self.fns = _index_fns(module)
+        self.prepared = sandbox_ast.prepare_module(module)
+        # with only "pure" allowed every call is deterministic, so repeated
+        # (fn, args) pairs and repeated arg/expect expressions across test
+        # cases can reuse the first result
+        self.call_cache: Optional[Dict[Any, Any]] = {} if set(allowed_effects or ["pure"]) <= {"pure"} else None
+        evaluator: Callable[[Any], Any] = sandbox_ast.ExprEvaluator(self.fns)
+        if self.call_cache is not None:
+            evaluator = _shared_eval(evaluator)
+        self.evaluator = evaluator
+
+    def run(self, fn: str, args: List[Any], exp: Any) -> Tuple[bool, Any, Any, Optional[str]]:
+        return run_testcase(
+            self.module, fn, args, exp, self.allowed_effects,
+            fns=self.fns, evaluator=self.evaluator, call_cache=self.call_cache, prepared=self.prepared,
+        )
+
+
+# Below this many cases, starting worker processes costs more than it saves.
+_PARALLEL_MIN_CASES = 64
+
+# Set in each worker process by `_init_worker`.
+_worker_runner: Optional[_Runner] = None
+
+
+def _init_worker(module: Dict[str, Any], allowed_effects: List[str]) -> None:
+    global _worker_runner
+    _worker_runner = _Runner(module, allowed_effects)
+
+
+def _run_chunk(chunk: List[Tuple[str, List[Any], Any]]) -> List[Tuple[bool, Any, Any, Optional[str]]]:
+    assert _worker_runner is not None
+    run = _worker_runner.run
+    return [run(fn, args, exp) for fn, args, exp in chunk]
+
+
+def iter_test_failures(module: Dict[str, Any], allowed_effects: List[str], *, jobs: int = 1) -> Iterator[Dict[str, Any]]:
+    """Run the module's tests, yielding each failure as soon as it is found.
+
+    With `jobs > 1` and enough cases, cases run in a process pool; failures are
+    still yielded in test order.
+    """
+    cases = _collect_cases(module)
+
+    if jobs > 1 and len(cases) >= _PARALLEL_MIN_CASES:
+        size = max(1, len(cases) // (jobs * 4))
+        chunks = [[(fn, args, exp) for _, _, _, fn, args, exp, _ in cases[i:i + size]] for i in range(0, len(cases), size)]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(module, allowed_effects)) as pool:
+            results = (r for chunk_results in pool.map(_run_chunk, chunks) for r in chunk_results)
+            for (prefix, what, ti, fn, _, _, label), result in zip(cases, results):
+                if not result[0]:
+                    yield _failure(prefix, what, ti, fn, label, result)
+        return
+
+    runner = _Runner(module, allowed_effects)
+    run = runner.run
+    for prefix, what, ti, fn, args, exp, label in cases:
+        result = run(fn, args, exp)
+        if not result[0]:
+            yield _failure(prefix, what, ti, fn, label, result)
+
+
+def run_tests(module: Dict[str, Any], allowed_effects: List[str], *, jobs: int = 1) -> List[Dict[str, Any]]:
+    return list(iter_test_failures(module, allowed_effects, jobs=jobs))
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -120,22 +290,32 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument("path", help="Path to Astra module JSON")
     ap.add_argument("--allowed", nargs="*", default=["pure"], help="Allowed effects")
     ap.add_argument("--json", action="store_true")
+    ap.add_argument("--jobs", type=int, default=1, help="Run test cases in N worker processes")
     args = ap.parse_args(argv)
 
     try:
-        module = json.loads(Path(args.path).read_text(encoding="utf-8"))
+        module = canonicalize_module(_json.load_path(args.path))
     except Exception as e:
         print(f"Failed to read/parse JSON: {e}", file=sys.stderr)
         return 3
 
-    failures = run_tests(module, args.allowed)
     if args.json:
-        print(json.dumps(failures, indent=2, ensure_ascii=False))
-    else:
-        for f in failures:
-            print(f"{f['pointer']}: {f['message']} ({f['detail']})")
+        if "io.print" in (args.allowed or ()):
+            # tests may print to stdout: finish them all before writing the
+            # array so that output can't land inside the document
+            failures = run_tests(module, args.allowed, jobs=args.jobs)
+            print(_json.dumps_indented(failures))
+            return 0 if not failures else 2
+        n_failed = _json.write_indented_array(iter_test_failures(module, args.allowed, jobs=args.jobs), sys.stdout)
+        return 0 if not n_failed else 2
+
+    # plain output: report each failure as it happens
+    failed = False
+    for f in iter_test_failures(module, args.allowed, jobs=args.jobs):
+        failed = True
+        print(f"{f['pointer']}: {f['message']} ({f['detail']})", flush=True)
 
-    return 0 if not failures else 2
+    return 0 if not failed else 2
 
 
 if __name__ == "__main__":
@@ -14,24 +14,62 @@ This is deliberately pragmatic (not full HM). It is designed to:
 from __future__ import annotations
 
 import argparse
-import json
+import concurrent.futures
+import functools
+import hashlib
+import re
 import sys
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
+from astra.tools import _json
 from astra.tools.pointer import join_pointer
 
 
+# Call sites repeat the same few names, so memoize (and intern) the split.
+@functools.lru_cache(maxsize=2048)
 def _qual_last(name: str) -> str:
-    return name.rsplit(".", 1)[-1]
+    return sys.intern(name.rsplit(".", 1)[-1])
+
+
+def _list(d: Dict[str, Any], key: str) -> List[Any]:
+    """`d[key]` if it is an array; missing, null and malformed values read as empty."""
+    v = d.get(key)
+    return v if isinstance(v, list) else []
+
+
+# Shared default for optional arrays that are only read (never mutated).
+_EMPTY: List[Any] = []
+
+
+# `dataclass(slots=True)` needs Python 3.10; on 3.9 the classes below keep a
+# per-instance __dict__. (Classes with only required fields declare
+# `__slots__` by hand instead.)
+_DC_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 # -------------------------
 # Type model
 # -------------------------
 
+# Kind tags: each concrete type class carries one, so the hot paths below
+# dispatch on an int compare instead of a chain of isinstance checks.
+_K_ANY = 0
+_K_PRIM = 1
+_K_VAR = 2
+_K_LIST = 3
+_K_RECORD = 4
+
+
 class Type:
+    __slots__ = ()
+
+    KIND = -1
+    # Whether the type mentions a type variable; computed lazily by `_has_vars`
+    # and cached on the instance (types are immutable once built).
+    _has_vars: Optional[bool] = None
+
     def render(self) -> str:
         raise NotImplementedError
 
@@ -41,28 +79,72 @@ class Type:
 
 @dataclass(frozen=True)
 class AnyType(Type):
+    __slots__ = ()
+
+    KIND = _K_ANY
+    _has_vars = False
+
+    def __new__(cls) -> "AnyType":
+        # a single shared instance (`ANY` below)
+        global _ANY_INSTANCE
+        if cls is not AnyType:
+            return super().__new__(cls)
+        if _ANY_INSTANCE is None:
+            _ANY_INSTANCE = super().__new__(cls)
+        return _ANY_INSTANCE
+
     def render(self) -> str:
         return "Any"
 
 
 @dataclass(frozen=True)
 class Prim(Type):
+    __slots__ = ("name",)
+
+    KIND = _K_PRIM
+    _has_vars = False
+
     name: str
 
+    def __new__(cls, name: Any = None) -> "Prim":
+        # one shared instance per primitive name
+        if cls is not Prim or name is None:
+            return super().__new__(cls)
+        p = _PRIM_CACHE.get(name)
+        if p is None:
+            p = _PRIM_CACHE[name] = super().__new__(cls)
+        return p
+
+    def __reduce__(self) -> Any:
+        # frozen slotted instances can't be restored attribute by attribute
+        return (type(self), (self.name,))
+
     def render(self) -> str:
         return self.name
 
 
 @dataclass(frozen=True)
 class Var(Type):
+    __slots__ = ("name",)
+
+    KIND = _K_VAR
+    _has_vars = True
+
     name: str
 
+    def __reduce__(self) -> Any:
+        return (type(self), (self.name,))
+
     def render(self) -> str:
         return self.name
 
 
 @dataclass(frozen=True)
 class ListT(Type):
+    # no __slots__: composite types cache `_has_vars` (and, for records, the
+    # hash and rendering) on the instance
+    KIND = _K_LIST
+
     elem: Type
 
     def render(self) -> str:
@@ -71,17 +153,55 @@ class ListT(Type):
 
 @dataclass(frozen=True)
 class RecordT(Type):
+    KIND = _K_RECORD
+    # render() and hash() results, cached on first use (not dataclass fields)
+    _rendered = None
+    _hash = None
+
     fields: Dict[str, Type]
 
+    def __hash__(self) -> int:
+        # equality ignores field order, so the hash must too
+        h = self._hash
+        if h is None:
+            h = hash(frozenset(self.fields.items()))
+            object.__setattr__(self, "_hash", h)
+        return h
+
     def render(self) -> str:
-        if not self.fields:
-            return "Record{}"
-        inside = ",".join(f"{k}:{v.render()}" for k, v in sorted(self.fields.items()))
-        return f"Record{{{inside}}}"
+        r = self._rendered
+        if r is None:
+            if not self.fields:
+                r = "Record{}"
+            else:
+                inside = ",".join(f"{k}:{v.render()}" for k, v in sorted(self.fields.items()))
+                r = f"Record{{{inside}}}"
+            object.__setattr__(self, "_rendered", r)
+        return r
 
 
 PRIMS = {"Int", "Float", "Bool", "String", "Null", "Any"}
 
+_ANY_INSTANCE: Optional[AnyType] = None
+_PRIM_CACHE: Dict[str, Prim] = {}
+
+# Shared instances: `Prim(name)` and `AnyType()` return these, so hot paths
+# neither allocate nor need more than an identity check.
+ANY = AnyType()
+PRIM_INT = Prim("Int")
+PRIM_FLOAT = Prim("Float")
+PRIM_BOOL = Prim("Bool")
+PRIM_STRING = Prim("String")
+PRIM_NULL = Prim("Null")
+
+_LITERAL_TYPES: Dict[type, Type] = {
+    type(None): PRIM_NULL,
+    bool: PRIM_BOOL,
+    int: PRIM_INT,
+    float: PRIM_FLOAT,
+    str: PRIM_STRING,
+}
+
 # Backwards-compatible aliases
 ListType = ListT
 RecordType = RecordT
@@ -91,32 +211,27 @@ RecordType = RecordT
 # Type parsing
 # -------------------------
 
-class _Tok:
-    def __init__(self, kind: str, text: str) -> None:
-        self.kind = kind
-        self.text = text
+class _Tok(NamedTuple):
+    kind: str
+    text: str
+
+
+# punctuation | identifier (str.isalnum() chars and "_") | anything else but
+# whitespace, which is skipped
+_TOK_RE = re.compile(r"([\[\]{}:,])|(\w+)|(\S)")
 
 
 def _tokenize(s: str) -> List[_Tok]:
     out: List[_Tok] = []
-    i = 0
-    while i < len(s):
-        c = s[i]
-        if c.isspace():
-            i += 1
-            continue
-        if c in "[]{}:,":
-            out.append(_Tok(c, c))
-            i += 1
-            continue
-        # identifier
-        j = i
-        while j < len(s) and (s[j].isalnum() or s[j] == "_"):
-            j += 1
-        if j == i:
+    for m in _TOK_RE.finditer(s):
+        punct, ident, bad = m.groups()
+        if punct is not None:
+            out.append(_Tok(punct, punct))
+        elif ident is not None:
+            out.append(_Tok("IDENT", ident))
+        else:
+            i = m.start()
             raise ValueError(f"Invalid type char at {i}: {s[i:i+10]!r}")
-        out.append(_Tok("IDENT", s[i:j]))
-        i = j
     return out
 
 
@@ -167,12 +282,15 @@ class _Parser:
             return RecordT(fields)
         if name in PRIMS:
             if name == "Any":
-                return AnyType()
+                return ANY
             return Prim(name)
         # type var
         return Var(name)
 
 
+# The same few annotations ("Int", "List[T]", ...) recur across functions and
+# runs; types are immutable, so parsed results can be shared.
+@functools.lru_cache(maxsize=4096)
 def parse_type_expr(expr: str) -> Type:
     toks = _tokenize(expr)
     p = _Parser(toks)
@@ -189,24 +307,54 @@ def parse_type_expr(expr: str) -> Type:
 Subst = Dict[str, Type]
 
 
+def _has_vars(ty: Type) -> bool:
+    hv = ty._has_vars
+    if hv is None:
+        kind = ty.KIND
+        if kind == _K_LIST:
+            hv = _has_vars(ty.elem)
+        elif kind == _K_RECORD:
+            hv = any(_has_vars(v) for v in ty.fields.values())
+        else:
+            hv = True
+        object.__setattr__(ty, "_has_vars", hv)
+    return hv
+
+
 def _apply(ty: Type, subst: Subst) -> Type:
-    if isinstance(ty, Var) and ty.name in subst:
-        return _apply(subst[ty.name], subst)
-    if isinstance(ty, ListT):
+    kind = ty.KIND
+    if kind == _K_PRIM:
+        return ty
+    if kind == _K_VAR:
+        if ty.name in subst:
+            return _apply(subst[ty.name], subst)
+        return ty
+    if not _has_vars(ty):
+        # no variable below: substitution cannot change anything
+        return ty
+    if kind == _K_LIST:
         return ListT(_apply(ty.elem, subst))
-    if isinstance(ty, RecordT):
+    if kind == _K_RECORD:
         return RecordT({k: _apply(v, subst) for k, v in ty.fields.items()})
     return ty
 
 
 def _occurs(var: str, ty: Type, subst: Subst) -> bool:
-    ty = _apply(ty, subst)
-    if isinstance(ty, Var):
-        return ty.name == var
-    if isinstance(ty, ListT):
-        return _occurs(var, ty.elem, subst)
-    if isinstance(ty, RecordT):
-        return any(_occurs(var, v, subst) for v in ty.fields.values())
+    # after one full substitution every remaining Var is unbound, so a plain
+    # walk over the result is enough
+    stack = [_apply(ty, subst)]
+    while stack:
+        t = stack.pop()
+        if not _has_vars(t):
+            continue
+        kind = t.KIND
+        if kind == _K_VAR:
+            if t.name == var:
+                return True
+        elif kind == _K_LIST:
+            stack.append(t.elem)
+        elif kind == _K_RECORD:
+            stack.extend(t.fields.values())
     return False
 
 
@@ -223,16 +371,37 @@ def unify(expected: Type, actual: Type, subst: Subst) -> bool:
 
     This may bind type variables appearing in expected (or actual).
     """
-    expected = _apply(expected, subst)
-    actual = _apply(actual, subst)
-
-    if isinstance(expected, AnyType):
+    # `Any` on either side (common: several builtins take Any parameters)
+    # and identical types unify without binding anything, so skip `_apply`
+    if expected is ANY or actual is ANY or expected is actual:
+        return True
+    # only the heads need resolving: the recursion below resolves the parts it
+    # visits, and a bound variable stores its type unapplied (`_apply` and
+    # `_occurs` see through the chain), so nothing is rebuilt here
+    while expected.KIND == _K_VAR and expected.name in subst:
+        expected = subst[expected.name]
+    while actual.KIND == _K_VAR and actual.name in subst:
+        actual = subst[actual.name]
+    ke = expected.KIND
+    ka = actual.KIND
+
+    if ke == _K_ANY:
         return True
-    if isinstance(actual, AnyType):
+    if ka == _K_ANY:
         # unknown actual is acceptable
         return True
 
-    if isinstance(expected, Var):
+    if ke == _K_PRIM:
+        if ka == _K_PRIM:
+            # primitives are interned: equal names mean the same instance
+            if expected is actual:
+                return True
+            j = _num_join(expected.name, actual.name)
+            return j is not None and j == expected.name
+        if ka != _K_VAR:
+            return False
+
+    if ke == _K_VAR:
         if expected.name in subst:
             return unify(subst[expected.name], actual, subst)
         if _occurs(expected.name, actual, subst):
@@ -240,7 +409,7 @@ def unify(expected: Type, actual: Type, subst: Subst) -> bool:
         subst[expected.name] = actual
         return True
 
-    if isinstance(actual, Var):
+    if ka == _K_VAR:
         if actual.name in subst:
             return unify(expected, subst[actual.name], subst)
         if _occurs(actual.name, expected, subst):
@@ -248,21 +417,23 @@ def unify(expected: Type, actual: Type, subst: Subst) -> bool:
         subst[actual.name] = expected
         return True
 
-    if isinstance(expected, Prim) and isinstance(actual, Prim):
-        if expected.name == actual.name:
-            return True
-        j = _num_join(expected.name, actual.name)
-        return j is not None and j == expected.name
+    if ke != ka:
+        return False
 
-    if isinstance(expected, ListT) and isinstance(actual, ListT):
+    if ke == _K_LIST:
         return unify(expected.elem, actual.elem, subst)
 
-    if isinstance(expected, RecordT) and isinstance(actual, RecordT):
+    if ke == _K_RECORD:
+        # the same variable-free record (hashes are cached on the instances):
+        # every field unifies with itself and nothing gets bound
+        if expected is actual or (not _has_vars(expected) and hash(expected) == hash(actual) and expected == actual):
+            return True
         # structural: actual may have extra fields, must contain expected fields
+        # (walked in expected's field order, which decides binding order)
+        afields = actual.fields
         for k, texp in expected.fields.items():
-            if k not in actual.fields:
-                return False
-            if not unify(texp, actual.fields[k], subst):
+            tact = afields.get(k)
+            if tact is None or not unify(texp, tact, subst):
                 return False
         return True
 
@@ -271,34 +442,44 @@ def unify(expected: Type, actual: Type, subst: Subst) -> bool:
 
 def join(t1: Type, t2: Type) -> Type:
     """Join (least upper bound) used for merging branch results."""
-    if isinstance(t1, AnyType) or isinstance(t2, AnyType):
-        return AnyType()
-    if isinstance(t1, Prim) and isinstance(t2, Prim):
-        j = _num_join(t1.name, t2.name)
-        return Prim(j) if j else AnyType()
-    if isinstance(t1, ListT) and isinstance(t2, ListT):
-        return ListT(join(t1.elem, t2.elem))
-    if isinstance(t1, RecordT) and isinstance(t2, RecordT):
-        common = set(t1.fields.keys()) & set(t2.fields.keys())
-        return RecordT({k: join(t1.fields[k], t2.fields[k]) for k in sorted(common)})
-    if isinstance(t1, Var):
+    if t1 is ANY or t2 is ANY:
+        return ANY
+    k1 = t1.KIND
+    k2 = t2.KIND
+    if k1 == k2:
+        if k1 == _K_PRIM:
+            if t1 is t2:
+                return t1
+            # distinct primitives only join as Int/Float -> Float
+            return PRIM_FLOAT if _num_join(t1.name, t2.name) else ANY
+        if k1 == _K_LIST:
+            return ListT(join(t1.elem, t2.elem))
+        if k1 == _K_RECORD:
+            common = t1.fields.keys() & t2.fields.keys()
+            return RecordT({k: join(t1.fields[k], t2.fields[k]) for k in sorted(common)})
+    if k1 == _K_VAR:
         return t2
-    if isinstance(t2, Var):
+    if k2 == _K_VAR:
         return t1
-    return AnyType()
+    return ANY
 
 
 # -------------------------
 # Diagnostics
 # -------------------------
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class Issue:
     pointer: str
     code: str
     message: str
     severity: str = "error"
 
+    def __reduce__(self) -> Any:
+        # plain constructor args pickle about twice as fast as the default
+        # slotted-dataclass state (issues cross process boundaries with --jobs)
+        return (type(self), (self.pointer, self.code, self.message, self.severity))
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "pointer": self.pointer,
@@ -312,13 +493,51 @@ class Issue:
 # Signatures
 # -------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DC_SLOTS)
 class Sig:
     name: str
     type_params: List[str]
     param_names: List[str]
     param_types: List[Type]
     ret: Type
+    # compiled argument checker, set by `_arg_checker`
+    _checker: Optional[Callable[[List[Type], "Subst"], List[int]]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __reduce__(self) -> Any:
+        # the compiled checker is rebuilt on demand rather than copied
+        return (type(self), (self.name, self.type_params, self.param_names, self.param_types, self.ret))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_arg_checker(param_types: Tuple[Type, ...]) -> Callable[[List[Type], Subst], List[int]]:
+    """Generate a straight-line argument check for fixed parameter types.
+
+    The generated function returns the indices of the arguments that fail to
+    unify. `Any` parameters are dropped, and an argument identical to its
+    parameter type or of type `Any` is accepted without calling `unify`, which
+    would succeed without binding anything in both cases.
+    """
+    ns: Dict[str, Any] = {"unify": unify}
+    lines = ["def check(args, subs):", "    bad = []"]
+    for i, t in enumerate(param_types):
+        if t.KIND == _K_ANY:
+            continue
+        ns[f"E{i}"] = t
+        lines.append(f"    a = args[{i}]")
+        lines.append(f"    if a is not E{i} and a.KIND != {_K_ANY} and not unify(E{i}, a, subs):")
+        lines.append(f"        bad.append({i})")
+    lines.append("    return bad")
+    exec("\n".join(lines), ns)
+    return ns["check"]
+
+
+def _arg_checker(sig: Sig) -> Callable[[List[Type], Subst], List[int]]:
+    """Argument checker for a signature without type params (cached on it)."""
+    check = sig._checker
+    if check is None:
+        check = _compile_arg_checker(tuple(sig.param_types))
+        object.__setattr__(sig, "_checker", check)
+    return check
 
 
 def _builtin_sigs() -> Dict[str, Sig]:
@@ -327,56 +546,63 @@ def _builtin_sigs() -> Dict[str, Sig]:
     T = Var("T")
     return {
         # arithmetic
-        "add": Sig("add", [], ["a", "b"], [Prim("Int"), Prim("Int")], Prim("Int")),
-        "sub": Sig("sub", [], ["a", "b"], [Prim("Int"), Prim("Int")], Prim("Int")),
-        "mul": Sig("mul", [], ["a", "b"], [Prim("Int"), Prim("Int")], Prim("Int")),
-        "div": Sig("div", [], ["a", "b"], [Prim("Int"), Prim("Int")], Prim("Float")),
+        "add": Sig("add", [], ["a", "b"], [PRIM_INT, PRIM_INT], PRIM_INT),
+        "sub": Sig("sub", [], ["a", "b"], [PRIM_INT, PRIM_INT], PRIM_INT),
+        "mul": Sig("mul", [], ["a", "b"], [PRIM_INT, PRIM_INT], PRIM_INT),
+        "div": Sig("div", [], ["a", "b"], [PRIM_INT, PRIM_INT], PRIM_FLOAT),
         # comparisons
-        "eq": Sig("eq", [], ["a", "b"], [AnyType(), AnyType()], Prim("Bool")),
-        "neq": Sig("neq", [], ["a", "b"], [AnyType(), AnyType()], Prim("Bool")),
-        "lt": Sig("lt", [], ["a", "b"], [Prim("Int"), Prim("Int")], Prim("Bool")),
-        "lte": Sig("lte", [], ["a", "b"], [Prim("Int"), Prim("Int")], Prim("Bool")),
-        "gt": Sig("gt", [], ["a", "b"], [Prim("Int"), Prim("Int")], Prim("Bool")),
-        "gte": Sig("gte", [], ["a", "b"], [Prim("Int"), Prim("Int")], Prim("Bool")),
+        "eq": Sig("eq", [], ["a", "b"], [ANY, ANY], PRIM_BOOL),
+        "neq": Sig("neq", [], ["a", "b"], [ANY, ANY], PRIM_BOOL),
+        "lt": Sig("lt", [], ["a", "b"], [PRIM_INT, PRIM_INT], PRIM_BOOL),
+        "lte": Sig("lte", [], ["a", "b"], [PRIM_INT, PRIM_INT], PRIM_BOOL),
+        "gt": Sig("gt", [], ["a", "b"], [PRIM_INT, PRIM_INT], PRIM_BOOL),
+        "gte": Sig("gte", [], ["a", "b"], [PRIM_INT, PRIM_INT], PRIM_BOOL),
         # boolean
-        "and": Sig("and", [], ["a", "b"], [Prim("Bool"), Prim("Bool")], Prim("Bool")),
-        "or": Sig("or", [], ["a", "b"], [Prim("Bool"), Prim("Bool")], Prim("Bool")),
-        "not": Sig("not", [], ["a"], [Prim("Bool")], Prim("Bool")),
+        "and": Sig("and", [], ["a", "b"], [PRIM_BOOL, PRIM_BOOL], PRIM_BOOL),
+        "or": Sig("or", [], ["a", "b"], [PRIM_BOOL, PRIM_BOOL], PRIM_BOOL),
+        "not": Sig("not", [], ["a"], [PRIM_BOOL], PRIM_BOOL),
         # strings
-        "str_len": Sig("str_len", [], ["s"], [Prim("String")], Prim("Int")),
-        "str_concat": Sig("str_concat", [], ["a", "b"], [Prim("String"), Prim("String")], Prim("String")),
-        "str_contains": Sig("str_contains", [], ["s", "sub"], [Prim("String"), Prim("String")], Prim("Bool")),
+        "str_len": Sig("str_len", [], ["s"], [PRIM_STRING], PRIM_INT),
+        "str_concat": Sig("str_concat", [], ["a", "b"], [PRIM_STRING, PRIM_STRING], PRIM_STRING),
+        "str_contains": Sig("str_contains", [], ["s", "sub"], [PRIM_STRING, PRIM_STRING], PRIM_BOOL),
         # lists
-        "len": Sig("len", ["T"], ["xs"], [ListT(Var("T"))], Prim("Int")),
-        "list_get": Sig("list_get", ["T"], ["xs", "i"], [ListT(Var("T")), Prim("Int")], Var("T")),
-        "list_set": Sig("list_set", ["T"], ["xs", "i", "v"], [ListT(Var("T")), Prim("Int"), Var("T")], ListT(Var("T"))),
+        "len": Sig("len", ["T"], ["xs"], [ListT(Var("T"))], PRIM_INT),
+        "list_get": Sig("list_get", ["T"], ["xs", "i"], [ListT(Var("T")), PRIM_INT], Var("T")),
+        "list_set": Sig("list_set", ["T"], ["xs", "i", "v"], [ListT(Var("T")), PRIM_INT, Var("T")], ListT(Var("T"))),
         "list_append": Sig("list_append", ["T"], ["xs", "v"], [ListT(Var("T")), Var("T")], ListT(Var("T"))),
         "list_concat": Sig("list_concat", ["T"], ["a", "b"], [ListT(Var("T")), ListT(Var("T"))], ListT(Var("T"))),
         # start/end can be Int or Null; we model them as Any for pragmatic flexibility
-        "list_slice": Sig("list_slice", ["T"], ["xs", "start", "end"], [ListT(Var("T")), AnyType(), AnyType()], ListT(Var("T"))),
-        "list_range": Sig("list_range", [], ["n"], [Prim("Int")], ListT(Prim("Int"))),
+        "list_slice": Sig("list_slice", ["T"], ["xs", "start", "end"], [ListT(Var("T")), ANY, ANY], ListT(Var("T"))),
+        "list_range": Sig("list_range", [], ["n"], [PRIM_INT], ListT(PRIM_INT)),
         # higher-order list ops (refined by special-case inference)
-        "list_map": Sig("list_map", ["T"], ["fn", "xs"], [Prim("String"), ListT(Var("T"))], ListT(AnyType())),
-        "list_filter": Sig("list_filter", ["T"], ["fn", "xs"], [Prim("String"), ListT(Var("T"))], ListT(Var("T"))),
-        "list_reduce": Sig("list_reduce", [], ["fn", "init", "xs"], [Prim("String"), AnyType(), ListT(AnyType())], AnyType()),
-        "list_sum": Sig("list_sum", [], ["xs"], [ListT(AnyType())], AnyType()),
-        "list_mean": Sig("list_mean", [], ["xs"], [ListT(AnyType())], Prim("Float")),
+        "list_map": Sig("list_map", ["T"], ["fn", "xs"], [PRIM_STRING, ListT(Var("T"))], ListT(ANY)),
+        "list_filter": Sig("list_filter", ["T"], ["fn", "xs"], [PRIM_STRING, ListT(Var("T"))], ListT(Var("T"))),
+        "list_reduce": Sig("list_reduce", [], ["fn", "init", "xs"], [PRIM_STRING, ANY, ListT(ANY)], ANY),
+        "list_sum": Sig("list_sum", [], ["xs"], [ListT(ANY)], ANY),
+        "list_mean": Sig("list_mean", [], ["xs"], [ListT(ANY)], PRIM_FLOAT),
         # objects/records (refined by special-case inference)
-        "obj_get": Sig("obj_get", [], ["obj", "key"], [AnyType(), Prim("String")], AnyType()),
-        "obj_get_or": Sig("obj_get_or", [], ["obj", "key", "default"], [AnyType(), Prim("String"), AnyType()], AnyType()),
-        "obj_has": Sig("obj_has", [], ["obj", "key"], [AnyType(), Prim("String")], Prim("Bool")),
-        "obj_set": Sig("obj_set", [], ["obj", "key", "value"], [AnyType(), Prim("String"), AnyType()], AnyType()),
-        "obj_del": Sig("obj_del", [], ["obj", "key"], [AnyType(), Prim("String")], AnyType()),
-        "obj_keys": Sig("obj_keys", [], ["obj"], [AnyType()], ListT(Prim("String"))),
-        "obj_merge": Sig("obj_merge", [], ["a", "b"], [AnyType(), AnyType()], AnyType()),
+        "obj_get": Sig("obj_get", [], ["obj", "key"], [ANY, PRIM_STRING], ANY),
+        "obj_get_or": Sig("obj_get_or", [], ["obj", "key", "default"], [ANY, PRIM_STRING, ANY], ANY),
+        "obj_has": Sig("obj_has", [], ["obj", "key"], [ANY, PRIM_STRING], PRIM_BOOL),
+        "obj_set": Sig("obj_set", [], ["obj", "key", "value"], [ANY, PRIM_STRING, ANY], ANY),
+        "obj_del": Sig("obj_del", [], ["obj", "key"], [ANY, PRIM_STRING], ANY),
+        "obj_keys": Sig("obj_keys", [], ["obj"], [ANY], ListT(PRIM_STRING)),
+        "obj_merge": Sig("obj_merge", [], ["a", "b"], [ANY, ANY], ANY),
         # effects
-        "print": Sig("print", [], ["x"], [AnyType()], Prim("Null")),
-        "http_get": Sig("http_get", [], ["url"], [Prim("String")], Prim("String")),
+        "print": Sig("print", [], ["x"], [ANY], PRIM_NULL),
+        "http_get": Sig("http_get", [], ["url"], [PRIM_STRING], PRIM_STRING),
     }
 
 
+# Built once; check_module copies it before adding the module's own functions.
+_BUILTIN_SIGS: Dict[str, Sig] = _builtin_sigs()
+
+
 def _freshen(sig: Sig, counter: List[int]) -> Tuple[Sig, Subst]:
     """Instantiate generic type params with fresh unique vars."""
+    if not sig.type_params:
+        # monomorphic: nothing to instantiate
+        return sig, {}
     subst: Subst = {}
     for tp in sig.type_params:
         counter[0] += 1
@@ -389,38 +615,246 @@ def _freshen(sig: Sig, counter: List[int]) -> Tuple[Sig, Subst]:
 
 
 def _type_of_literal(v: Any) -> Type:
+    # exact JSON types resolve with one dict lookup; subclasses take the checks below
+    t = _LITERAL_TYPES.get(type(v))
+    if t is not None:
+        return t
     if v is None:
-        return Prim("Null")
+        return PRIM_NULL
     if isinstance(v, bool):
-        return Prim("Bool")
+        return PRIM_BOOL
     if isinstance(v, int) and not isinstance(v, bool):
-        return Prim("Int")
+        return PRIM_INT
     if isinstance(v, float):
-        return Prim("Float")
+        return PRIM_FLOAT
     if isinstance(v, str):
-        return Prim("String")
-    return AnyType()
+        return PRIM_STRING
+    return ANY
 
 
 def _join(a: Type, b: Type) -> Type:
-    a = _apply(a, {})
-    b = _apply(b, {})
-    if isinstance(a, AnyType) or isinstance(b, AnyType):
-        return AnyType()
-    if isinstance(a, Prim) and isinstance(b, Prim):
-        if a.name == b.name:
+    if a is ANY or b is ANY:
+        return ANY
+    ka = a.KIND
+    kb = b.KIND
+    if ka != kb:
+        return ANY
+    if ka == _K_PRIM:
+        if a is b:
             return a
         if {a.name, b.name} == {"Int", "Float"}:
-            return Prim("Float")
-        return AnyType()
-    if isinstance(a, ListType) and isinstance(b, ListType):
+            return PRIM_FLOAT
+        return ANY
+    if ka == _K_LIST:
         return ListT(_join(a.elem, b.elem))
-    if isinstance(a, RecordType) and isinstance(b, RecordType):
-        common = set(a.fields.keys()) & set(b.fields.keys())
+    if ka == _K_RECORD:
+        common = a.fields.keys() & b.fields.keys()
         return RecordT({k: _join(a.fields[k], b.fields[k]) for k in sorted(common)})
-    if isinstance(a, Var) and isinstance(b, Var) and a.name == b.name:
+    if ka == _K_VAR and a.name == b.name:
         return a
-    return AnyType()
+    return ANY
+
+
+# Special-case inference for a few stdlib calls.
+#
+# This keeps Astra's core type system small while enabling ergonomic stdlib features:
+# - higher-order list ops (list_map/list_filter/list_reduce) where the first arg is
+#   a string literal function name
+# - record field access via obj_get/obj_get_or/obj_set/obj_del when the key is a string literal
+# - numeric list aggregations list_sum/list_mean
+#
+# Each handler gets the call's (unqualified) name, argument expressions and
+# inferred argument types, and returns None to fall back to the signature.
+_SpecialHandler = Callable[[str, List[Any], List[Type], List[Any], List[Issue], Dict[str, Sig], List[int]], Optional[Type]]
+
+
+# -------------------------
+# list_sum / list_mean
+# -------------------------
+
+def _special_list_sum(fn_last: str, args_expr: List[Any], arg_types: List[Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int]) -> Optional[Type]:
+    if len(arg_types) != 1:
+        return None
+    xs_t = arg_types[0]
+    if xs_t.KIND != _K_LIST:
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f'list_sum expects a list, got {xs_t}'))
+        return ANY
+    elem = xs_t.elem
+    if elem.KIND == _K_PRIM and elem.name in {'Int', 'Float'}:
+        return elem
+    if elem.KIND == _K_ANY or elem.KIND == _K_VAR:
+        return ANY
+    issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f'list_sum expects List[Int] or List[Float], got {xs_t}'))
+    return ANY
+
+
+def _special_list_mean(fn_last: str, args_expr: List[Any], arg_types: List[Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int]) -> Optional[Type]:
+    if len(arg_types) != 1:
+        return None
+    xs_t = arg_types[0]
+    if xs_t.KIND != _K_LIST:
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f'list_mean expects a list, got {xs_t}'))
+        return PRIM_FLOAT
+    elem = xs_t.elem
+    if elem.KIND == _K_PRIM and elem.name in {'Int', 'Float'}:
+        return PRIM_FLOAT
+    if elem.KIND == _K_ANY or elem.KIND == _K_VAR:
+        return PRIM_FLOAT
+    issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f'list_mean expects List[Int] or List[Float], got {xs_t}'))
+    return PRIM_FLOAT
+
+
+# -------------------------
+# Higher-order list ops
+# -------------------------
+
+def _special_list_map(fn_last: str, args_expr: List[Any], arg_types: List[Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int]) -> Optional[Type]:
+    # list_map and list_filter
+    if len(arg_types) != 2:
+        return None
+    fn_ref = args_expr[0]
+    xs_t = arg_types[1]
+    if not isinstance(fn_ref, str):
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeError', f"{fn_last} expects first arg to be a string function name"))
+        return ListT(ANY)
+    if xs_t.KIND != _K_LIST:
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 1]), 'TypeMismatch', f"{fn_last} expects a list as second arg, got {xs_t}"))
+        return ListT(ANY)
+    callee_last = _qual_last(fn_ref)
+    callee_sig = sigs.get(callee_last) or sigs.get(fn_ref)
+    if callee_sig is None:
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'UnknownFunctionCall', f"Unknown function: {fn_ref}"))
+        return ListT(ANY)
+    callee_inst, _ = _freshen(callee_sig, counter)
+    if len(callee_inst.param_types) != 1:
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'ArityMismatch', f"{fn_last} expects '{fn_ref}' to take 1 arg, but it takes {len(callee_inst.param_types)}"))
+        return ListT(ANY)
+    subs: Subst = {}
+    if not unify(callee_inst.param_types[0], xs_t.elem, subs):
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 1]), 'TypeMismatch', f"{fn_ref} expects {callee_inst.param_types[0]} but list has {xs_t.elem}"))
+    ret_t = _apply(callee_inst.ret, subs)
+    if fn_last == 'list_filter':
+        subs2: Subst = {}
+        if not unify(PRIM_BOOL, ret_t, subs2):
+            issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f"{fn_ref} used in list_filter must return Bool, got {ret_t}"))
+        return xs_t
+    # list_map
+    return ListT(ret_t)
+
+
+def _special_list_reduce(fn_last: str, args_expr: List[Any], arg_types: List[Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int]) -> Optional[Type]:
+    if len(arg_types) != 3:
+        return None
+    fn_ref = args_expr[0]
+    init_t = arg_types[1]
+    xs_t = arg_types[2]
+    if not isinstance(fn_ref, str):
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeError', 'list_reduce expects first arg to be a string function name'))
+        return init_t
+    if xs_t.KIND != _K_LIST:
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 2]), 'TypeMismatch', f'list_reduce expects a list as third arg, got {xs_t}'))
+        return init_t
+    callee_last = _qual_last(fn_ref)
+    callee_sig = sigs.get(callee_last) or sigs.get(fn_ref)
+    if callee_sig is None:
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'UnknownFunctionCall', f'Unknown function: {fn_ref}'))
+        return init_t
+    callee_inst, _ = _freshen(callee_sig, counter)
+    if len(callee_inst.param_types) != 2:
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'ArityMismatch', f"list_reduce expects '{fn_ref}' to take 2 args, but it takes {len(callee_inst.param_types)}"))
+        return init_t
+    subs: Subst = {}
+    if not unify(callee_inst.param_types[0], init_t, subs):
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 1]), 'TypeMismatch', f"{fn_ref} first param expects {callee_inst.param_types[0]} but init is {init_t}"))
+    if not unify(callee_inst.param_types[1], xs_t.elem, subs):
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 2]), 'TypeMismatch', f"{fn_ref} second param expects {callee_inst.param_types[1]} but list has {xs_t.elem}"))
+    ret_t = _apply(callee_inst.ret, subs)
+    subs2: Subst = {}
+    if not unify(init_t, ret_t, subs2):
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f"{fn_ref} used in list_reduce must return a type compatible with init ({init_t}), got {ret_t}"))
+    return init_t
+
+
+# -------------------------
+# Record helpers via obj_* when key is a string literal
+# -------------------------
+# These only kick in when the key is a literal string and we have record types.
+
+def _special_obj_get(fn_last: str, args_expr: List[Any], arg_types: List[Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int]) -> Optional[Type]:
+    # obj_get and obj_del
+    if len(arg_types) != 2:
+        return None
+    obj_t = arg_types[0]
+    key = args_expr[1]
+    if obj_t.KIND == _K_RECORD and isinstance(key, str):
+        if fn_last == 'obj_get':
+            if key in obj_t.fields:
+                return obj_t.fields[key]
+            issues.append(Issue(join_pointer(ptr + ['call', 'args', 1]), 'UnknownField', f"Record has no field '{key}'"))
+            return ANY
+        # obj_del
+        new_fields = dict(obj_t.fields)
+        new_fields.pop(key, None)
+        return RecordT(new_fields)
+    return None
+
+
+def _special_obj_get_or(fn_last: str, args_expr: List[Any], arg_types: List[Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int]) -> Optional[Type]:
+    if len(arg_types) != 3:
+        return None
+    obj_t = arg_types[0]
+    key = args_expr[1]
+    default_t = arg_types[2]
+    if obj_t.KIND == _K_RECORD and isinstance(key, str):
+        if key in obj_t.fields:
+            return _join(obj_t.fields[key], default_t)
+        issues.append(Issue(join_pointer(ptr + ['call', 'args', 1]), 'UnknownField', f"Record has no field '{key}'"))
+        return _join(ANY, default_t)
+    return None
+
+
+def _special_obj_set(fn_last: str, args_expr: List[Any], arg_types: List[Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int]) -> Optional[Type]:
+    if len(arg_types) != 3:
+        return None
+    obj_t = arg_types[0]
+    key = args_expr[1]
+    val_t = arg_types[2]
+    if obj_t.KIND == _K_RECORD and isinstance(key, str):
+        new_fields = dict(obj_t.fields)
+        if key in new_fields:
+            new_fields[key] = _join(new_fields[key], val_t)
+        else:
+            new_fields[key] = val_t
+        return RecordT(new_fields)
+    return None
+
+
+def _special_obj_merge(fn_last: str, args_expr: List[Any], arg_types: List[Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int]) -> Optional[Type]:
+    if len(arg_types) != 2:
+        return None
+    a_t = arg_types[0]
+    b_t = arg_types[1]
+    if a_t.KIND == _K_RECORD and b_t.KIND == _K_RECORD:
+        merged = dict(a_t.fields)
+        for k, v in b_t.fields.items():
+            prev = merged.get(k)
+            merged[k] = v if prev is None else _join(prev, v)
+        return RecordT(merged)
+    return None
+
+
+_SPECIAL_HANDLERS: Dict[str, _SpecialHandler] = {
+    'list_sum': _special_list_sum,
+    'list_mean': _special_list_mean,
+    'list_map': _special_list_map,
+    'list_filter': _special_list_map,
+    'list_reduce': _special_list_reduce,
+    'obj_get': _special_obj_get,
+    'obj_del': _special_obj_get,
+    'obj_get_or': _special_obj_get_or,
+    'obj_set': _special_obj_set,
+    'obj_merge': _special_obj_merge,
+}
 
 
 def _infer_special_call(
@@ -434,226 +868,94 @@ def _infer_special_call(
     sigs: Dict[str, Sig],
     counter: List[int],
 ) -> Optional[Type]:
-    """Special-case inference for a few stdlib calls.
+    """Special-case inference for a few stdlib calls (see `_SPECIAL_HANDLERS`).
 
-    This keeps Astra's core type system small while enabling ergonomic stdlib features:
-    - higher-order list ops (list_map/list_filter/list_reduce) where the first arg is
-      a string literal function name
-    - record field access via obj_get/obj_get_or/obj_set/obj_del when the key is a string literal
-    - numeric list aggregations list_sum/list_mean
+    Returns None when the call is not special and the signature applies.
     """
-
-    # -------------------------
-    # list_sum / list_mean
-    # -------------------------
-    if fn_last == 'list_sum' and len(arg_types) == 1:
-        xs_t = arg_types[0]
-        if not isinstance(xs_t, ListT):
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f'list_sum expects a list, got {xs_t}'))
-            return AnyType()
-        elem = _apply(xs_t.elem, {})
-        if isinstance(elem, Prim) and elem.name in {'Int', 'Float'}:
-            return elem
-        if isinstance(elem, AnyType) or isinstance(elem, Var):
-            return AnyType()
-        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f'list_sum expects List[Int] or List[Float], got {xs_t}'))
-        return AnyType()
-
-    if fn_last == 'list_mean' and len(arg_types) == 1:
-        xs_t = arg_types[0]
-        if not isinstance(xs_t, ListT):
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f'list_mean expects a list, got {xs_t}'))
-            return Prim('Float')
-        elem = _apply(xs_t.elem, {})
-        if isinstance(elem, Prim) and elem.name in {'Int', 'Float'}:
-            return Prim('Float')
-        if isinstance(elem, AnyType) or isinstance(elem, Var):
-            return Prim('Float')
-        issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f'list_mean expects List[Int] or List[Float], got {xs_t}'))
-        return Prim('Float')
-
-    # -------------------------
-    # Higher-order list ops
-    # -------------------------
-    if fn_last in {'list_map', 'list_filter'} and len(arg_types) == 2:
-        fn_ref = args_expr[0]
-        xs_t = arg_types[1]
-        if not isinstance(fn_ref, str):
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeError', f"{fn_last} expects first arg to be a string function name"))
-            return ListT(AnyType())
-        if not isinstance(xs_t, ListT):
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 1]), 'TypeMismatch', f"{fn_last} expects a list as second arg, got {xs_t}"))
-            return ListT(AnyType())
-        callee_last = _qual_last(fn_ref)
-        callee_sig = sigs.get(callee_last) or sigs.get(fn_ref)
-        if callee_sig is None:
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'UnknownFunctionCall', f"Unknown function: {fn_ref}"))
-            return ListT(AnyType())
-        callee_inst, _ = _freshen(callee_sig, counter)
-        if len(callee_inst.param_types) != 1:
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'ArityMismatch', f"{fn_last} expects '{fn_ref}' to take 1 arg, but it takes {len(callee_inst.param_types)}"))
-            return ListT(AnyType())
-        subs: Subst = {}
-        if not unify(callee_inst.param_types[0], xs_t.elem, subs):
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 1]), 'TypeMismatch', f"{fn_ref} expects {callee_inst.param_types[0]} but list has {xs_t.elem}"))
-        ret_t = _apply(callee_inst.ret, subs)
-        if fn_last == 'list_filter':
-            subs2: Subst = {}
-            if not unify(Prim('Bool'), ret_t, subs2):
-                issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f"{fn_ref} used in list_filter must return Bool, got {ret_t}"))
-            return xs_t
-        # list_map
-        return ListT(ret_t)
-
-    if fn_last == 'list_reduce' and len(arg_types) == 3:
-        fn_ref = args_expr[0]
-        init_t = arg_types[1]
-        xs_t = arg_types[2]
-        if not isinstance(fn_ref, str):
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeError', 'list_reduce expects first arg to be a string function name'))
-            return init_t
-        if not isinstance(xs_t, ListT):
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 2]), 'TypeMismatch', f'list_reduce expects a list as third arg, got {xs_t}'))
-            return init_t
-        callee_last = _qual_last(fn_ref)
-        callee_sig = sigs.get(callee_last) or sigs.get(fn_ref)
-        if callee_sig is None:
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'UnknownFunctionCall', f'Unknown function: {fn_ref}'))
-            return init_t
-        callee_inst, _ = _freshen(callee_sig, counter)
-        if len(callee_inst.param_types) != 2:
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'ArityMismatch', f"list_reduce expects '{fn_ref}' to take 2 args, but it takes {len(callee_inst.param_types)}"))
-            return init_t
-        subs: Subst = {}
-        if not unify(callee_inst.param_types[0], init_t, subs):
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 1]), 'TypeMismatch', f"{fn_ref} first param expects {callee_inst.param_types[0]} but init is {init_t}"))
-        if not unify(callee_inst.param_types[1], xs_t.elem, subs):
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 2]), 'TypeMismatch', f"{fn_ref} second param expects {callee_inst.param_types[1]} but list has {xs_t.elem}"))
-        ret_t = _apply(callee_inst.ret, subs)
-        subs2: Subst = {}
-        if not unify(init_t, ret_t, subs2):
-            issues.append(Issue(join_pointer(ptr + ['call', 'args', 0]), 'TypeMismatch', f"{fn_ref} used in list_reduce must return a type compatible with init ({init_t}), got {ret_t}"))
-        return init_t
-
-    # -------------------------
-    # Record helpers via obj_* when key is a string literal
-    # -------------------------
-    if fn_last in {'obj_get', 'obj_get_or', 'obj_set', 'obj_del', 'obj_merge'}:
-        # only kick in when the key is a literal string and we have record types
-        if fn_last in {'obj_get', 'obj_del'} and len(arg_types) == 2:
-            obj_t = arg_types[0]
-            key = args_expr[1]
-            if isinstance(obj_t, RecordT) and isinstance(key, str):
-                if fn_last == 'obj_get':
-                    if key in obj_t.fields:
-                        return obj_t.fields[key]
-                    issues.append(Issue(join_pointer(ptr + ['call', 'args', 1]), 'UnknownField', f"Record has no field '{key}'"))
-                    return AnyType()
-                # obj_del
-                new_fields = dict(obj_t.fields)
-                new_fields.pop(key, None)
-                return RecordT(new_fields)
-            return None
-
-        if fn_last == 'obj_get_or' and len(arg_types) == 3:
-            obj_t = arg_types[0]
-            key = args_expr[1]
-            default_t = arg_types[2]
-            if isinstance(obj_t, RecordT) and isinstance(key, str):
-                if key in obj_t.fields:
-                    return _join(obj_t.fields[key], default_t)
-                issues.append(Issue(join_pointer(ptr + ['call', 'args', 1]), 'UnknownField', f"Record has no field '{key}'"))
-                return _join(AnyType(), default_t)
-            return None
-
-        if fn_last == 'obj_set' and len(arg_types) == 3:
-            obj_t = arg_types[0]
-            key = args_expr[1]
-            val_t = arg_types[2]
-            if isinstance(obj_t, RecordT) and isinstance(key, str):
-                new_fields = dict(obj_t.fields)
-                if key in new_fields:
-                    new_fields[key] = _join(new_fields[key], val_t)
-                else:
-                    new_fields[key] = val_t
-                return RecordT(new_fields)
-            return None
-
-        if fn_last == 'obj_merge' and len(arg_types) == 2:
-            a_t = arg_types[0]
-            b_t = arg_types[1]
-            if isinstance(a_t, RecordT) and isinstance(b_t, RecordT):
-                merged = dict(a_t.fields)
-                for k, v in b_t.fields.items():
-                    if k in merged:
-                        merged[k] = _join(merged[k], v)
-                    else:
-                        merged[k] = v
-                return RecordT(merged)
-            return None
-
-    return None
+    h = _SPECIAL_HANDLERS.get(fn_last)
+    if h is None:
+        return None
+    return h(fn_last, args_expr, arg_types, ptr, issues, sigs, counter)
 
 def _infer_expr(expr: Any, env: Dict[str, Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int]) -> Type:
+    # `ptr` is a shared path stack: children push their segments and pop them
+    # before returning; it is only joined into a string when an issue is emitted
     # literals
-    if isinstance(expr, (int, float, str, bool)) or expr is None:
-        return _type_of_literal(expr)
-
-    if not isinstance(expr, dict):
-        issues.append(Issue(join_pointer(ptr), "TypeError", "Expression must be literal or object"))
-        return AnyType()
+    lit = _LITERAL_TYPES.get(type(expr))
+    if lit is not None:
+        return lit
+    # plain dicts (every non-literal node) skip the subclass checks
+    if type(expr) is not dict:
+        if isinstance(expr, (int, float, str, bool)):
+            return _type_of_literal(expr)
+        if not isinstance(expr, dict):
+            issues.append(Issue(join_pointer(ptr), "TypeError", "Expression must be literal or object"))
+            return ANY
 
     if "var" in expr:
         name = expr.get("var")
         if not isinstance(name, str):
             issues.append(Issue(join_pointer(ptr + ["var"]), "TypeError", "var must be a string"))
-            return AnyType()
+            return ANY
         if name not in env:
             issues.append(Issue(join_pointer(ptr + ["var"]), "UndefinedVariable", f"Undefined variable: {name}"))
-            return AnyType()
+            return ANY
         return env[name]
 
     if "list" in expr:
         arr = expr.get("list")
         if not isinstance(arr, list):
             issues.append(Issue(join_pointer(ptr + ["list"]), "TypeError", "list must be an array"))
-            return AnyType()
+            return ANY
         if not arr:
-            return ListT(AnyType())
-        t = _infer_expr(arr[0], env, ptr + ["list", 0], issues, sigs, counter)
+            return ListT(ANY)
+        ptr.append("list")
+        ptr.append(0)
+        t = _infer_expr(arr[0], env, ptr, issues, sigs, counter)
         for i in range(1, len(arr)):
-            ti = _infer_expr(arr[i], env, ptr + ["list", i], issues, sigs, counter)
+            ptr[-1] = i
+            ti = _infer_expr(arr[i], env, ptr, issues, sigs, counter)
             t = _join(t, ti)
+        del ptr[-2:]
         return ListT(t)
 
     if "obj" in expr:
         obj = expr.get("obj")
         if not isinstance(obj, dict):
             issues.append(Issue(join_pointer(ptr + ["obj"]), "TypeError", "obj must be an object"))
-            return AnyType()
+            return ANY
         fields: Dict[str, Type] = {}
+        ptr.append("obj")
+        ptr.append(None)
         for k, v in obj.items():
-            fields[k] = _infer_expr(v, env, ptr + ["obj", k], issues, sigs, counter)
+            ptr[-1] = k
+            fields[k] = _infer_expr(v, env, ptr, issues, sigs, counter)
+        del ptr[-2:]
         return RecordT(fields)
 
     if "call" in expr:
         call = expr.get("call")
         if not isinstance(call, dict):
             issues.append(Issue(join_pointer(ptr + ["call"]), "TypeError", "call must be an object"))
-            return AnyType()
+            return ANY
         fn = call.get("fn")
-        args = call.get("args", [])
+        args = call.get("args", _EMPTY)
         if not isinstance(fn, str):
             issues.append(Issue(join_pointer(ptr + ["call", "fn"]), "TypeError", "call.fn must be a string"))
-            return AnyType()
+            return ANY
         if not isinstance(args, list):
             issues.append(Issue(join_pointer(ptr + ["call", "args"]), "TypeError", "call.args must be an array"))
-            return AnyType()
+            return ANY
 
         # Infer arg types first
         arg_types: List[Type] = []
+        ptr.append("call")
+        ptr.append("args")
+        ptr.append(0)
         for i, a in enumerate(args):
-            arg_types.append(_infer_expr(a, env, ptr + ["call", "args", i], issues, sigs, counter))
+            ptr[-1] = i
+            arg_types.append(_infer_expr(a, env, ptr, issues, sigs, counter))
+        del ptr[-3:]
         fn_last = _qual_last(fn)
 
         special = _infer_special_call(fn_last, fn, args, arg_types, env, ptr, issues, sigs, counter)
@@ -663,24 +965,29 @@ def _infer_expr(expr: Any, env: Dict[str, Type], ptr: List[Any], issues: List[Is
         sig = sigs.get(fn_last) or sigs.get(fn)
         if sig is None:
             issues.append(Issue(join_pointer(ptr + ["call", "fn"]), "UnknownFunctionCall", f"Unknown function: {fn}"))
-            return AnyType()
+            return ANY
 
         inst, _ = _freshen(sig, counter)
         if len(arg_types) != len(inst.param_types):
             issues.append(Issue(join_pointer(ptr + ["call"]), "ArityMismatch", f"{fn} expects {len(inst.param_types)} args but got {len(arg_types)}"))
-            return AnyType()
+            return ANY
 
         subs: Subst = {}
         # unify params
-        for i, (expected, actual) in enumerate(zip(inst.param_types, arg_types)):
-            ok = unify(expected, actual, subs)
-            if not ok:
-                issues.append(Issue(join_pointer(ptr + ["call", "args", i]), "TypeMismatch", f"Arg {i} to {fn} expected {expected} but got {actual}"))
+        if not sig.type_params:
+            # monomorphic (`inst` is `sig`): use its precompiled checker
+            for i in _arg_checker(sig)(arg_types, subs):
+                issues.append(Issue(join_pointer(ptr + ["call", "args", i]), "TypeMismatch", f"Arg {i} to {fn} expected {inst.param_types[i]} but got {arg_types[i]}"))
+        else:
+            for i, (expected, actual) in enumerate(zip(inst.param_types, arg_types)):
+                ok = unify(expected, actual, subs)
+                if not ok:
+                    issues.append(Issue(join_pointer(ptr + ["call", "args", i]), "TypeMismatch", f"Arg {i} to {fn} expected {expected} but got {actual}"))
 
         return _apply(inst.ret, subs)
 
     issues.append(Issue(join_pointer(ptr), "TypeError", f"Unknown expr form: {list(expr.keys())}"))
-    return AnyType()
+    return ANY
 
 
 def _check_stmt(stmt: Any, env: Dict[str, Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int], ret_ann: Type, ret_seen: List[Type]) -> Tuple[Dict[str, Type], bool]:
@@ -701,31 +1008,42 @@ def _check_stmt(stmt: Any, env: Dict[str, Type], ptr: List[Any], issues: List[Is
             issues.append(Issue(join_pointer(ptr + ["let", "name"]), "TypeError", "let.name must be a string"))
             return env, False
         expr = val.get("expr")
-        t = _infer_expr(expr, env, ptr + ["let", "expr"], issues, sigs, counter)
+        ptr.append("let")
+        ptr.append("expr")
+        t = _infer_expr(expr, env, ptr, issues, sigs, counter)
+        del ptr[-2:]
         if name in env:
             # semantic checker already flags; keep as type error too
             issues.append(Issue(join_pointer(ptr + ["let", "name"]), "Rebind", f"Variable '{name}' is already defined"))
-        new_env = dict(env)
-        new_env[name] = t
-        return new_env, False
+        # each block owns its env (`_check_block` callers pass a copy), so
+        # bind in place instead of copying the env per statement
+        env[name] = t
+        return env, False
 
     if tag == "assert":
         if not isinstance(val, dict):
             issues.append(Issue(join_pointer(ptr + ["assert"]), "TypeError", "assert must be an object"))
             return env, False
         e = val.get("expr")
-        t = _infer_expr(e, env, ptr + ["assert", "expr"], issues, sigs, counter)
+        ptr.append("assert")
+        ptr.append("expr")
+        t = _infer_expr(e, env, ptr, issues, sigs, counter)
+        del ptr[-2:]
         subs: Subst = {}
-        if not unify(Prim("Bool"), t, subs):
+        if not unify(PRIM_BOOL, t, subs):
             issues.append(Issue(join_pointer(ptr + ["assert", "expr"]), "TypeMismatch", f"assert expr must be Bool, got {t}"))
         return env, False
 
     if tag == "expr":
-        _infer_expr(val, env, ptr + ["expr"], issues, sigs, counter)
+        ptr.append("expr")
+        _infer_expr(val, env, ptr, issues, sigs, counter)
+        ptr.pop()
         return env, False
 
     if tag == "return":
-        t = _infer_expr(val, env, ptr + ["return"], issues, sigs, counter)
+        ptr.append("return")
+        t = _infer_expr(val, env, ptr, issues, sigs, counter)
+        ptr.pop()
         # check return annotation
         subs: Subst = {}
         if not unify(ret_ann, t, subs):
@@ -738,19 +1056,26 @@ def _check_stmt(stmt: Any, env: Dict[str, Type], ptr: List[Any], issues: List[Is
             issues.append(Issue(join_pointer(ptr + ["if"]), "TypeError", "if must be an object"))
             return env, False
         cond = val.get("cond")
-        tcond = _infer_expr(cond, env, ptr + ["if", "cond"], issues, sigs, counter)
+        ptr.append("if")
+        ptr.append("cond")
+        tcond = _infer_expr(cond, env, ptr, issues, sigs, counter)
+        del ptr[-2:]
         subs: Subst = {}
-        if not unify(Prim("Bool"), tcond, subs):
+        if not unify(PRIM_BOOL, tcond, subs):
             issues.append(Issue(join_pointer(ptr + ["if", "cond"]), "TypeMismatch", f"if.cond must be Bool, got {tcond}"))
 
-        then = val.get("then", [])
-        els = val.get("else", [])
+        then = val.get("then", _EMPTY)
+        els = val.get("else", _EMPTY)
         if not isinstance(then, list) or not isinstance(els, list):
             issues.append(Issue(join_pointer(ptr + ["if"]), "TypeError", "if.then and if.else must be arrays"))
             return env, False
 
-        env_then, ret_then = _check_block(then, dict(env), ptr + ["if", "then"], issues, sigs, counter, ret_ann, ret_seen)
-        env_else, ret_else = _check_block(els, dict(env), ptr + ["if", "else"], issues, sigs, counter, ret_ann, ret_seen)
+        ptr.append("if")
+        ptr.append("then")
+        env_then, ret_then = _check_block(then, dict(env), ptr, issues, sigs, counter, ret_ann, ret_seen)
+        ptr[-1] = "else"
+        env_else, ret_else = _check_block(els, dict(env), ptr, issues, sigs, counter, ret_ann, ret_seen)
+        del ptr[-2:]
 
         # merge env: keep vars defined in both, join types
         merged: Dict[str, Type] = {}
@@ -769,117 +1094,317 @@ def _check_stmt(stmt: Any, env: Dict[str, Type], ptr: List[Any], issues: List[Is
 def _check_block(stmts: List[Any], env: Dict[str, Type], ptr: List[Any], issues: List[Issue], sigs: Dict[str, Sig], counter: List[int], ret_ann: Type, ret_seen: List[Type]) -> Tuple[Dict[str, Type], bool]:
     always_returns = False
     cur_env = env
+    ptr.append(0)
     for i, s in enumerate(stmts):
-        if always_returns:
-            # still scan for type errors inside? keep noise low; skip.
-            continue
-        cur_env, ar = _check_stmt(s, cur_env, ptr + [i], issues, sigs, counter, ret_ann, ret_seen)
+        ptr[-1] = i
+        cur_env, ar = _check_stmt(s, cur_env, ptr, issues, sigs, counter, ret_ann, ret_seen)
         if ar:
+            # statements after this are unreachable; still scan them for type
+            # errors? keep noise low; skip.
             always_returns = True
+            break
+    ptr.pop()
     return cur_env, always_returns
 
 
 def _sig_from_function(fn: Dict[str, Any]) -> Sig:
     name = fn.get("name")
-    params = fn.get("params", []) or []
+    params = _list(fn, "params")
     if not isinstance(name, str):
         name = "<anon>"
-    if not isinstance(params, list):
-        params = []
     param_names = [p if isinstance(p, str) else "_" for p in params]
 
-    type_params = fn.get("type_params", []) or []
-    if not isinstance(type_params, list):
-        type_params = []
-    type_params = [tp for tp in type_params if isinstance(tp, str)]
+    type_params = [tp for tp in _list(fn, "type_params") if isinstance(tp, str)]
 
     # param_types optional
     pt_raw = fn.get("param_types")
     if isinstance(pt_raw, list) and len(pt_raw) == len(param_names):
         param_types = [parse_type_expr(t) for t in pt_raw]
     else:
-        param_types = [AnyType() for _ in param_names]
+        param_types = [ANY] * len(param_names)
 
     ret_raw = fn.get("returns")
-    ret = parse_type_expr(ret_raw) if isinstance(ret_raw, str) else AnyType()
+    ret = parse_type_expr(ret_raw) if isinstance(ret_raw, str) else ANY
 
     return Sig(name, type_params, param_names, param_types, ret)
 
 
-def check_module(module: Dict[str, Any]) -> List[Dict[str, Any]]:
-    issues: List[Issue] = []
+def _check_function(fn: Dict[str, Any], fi: int, name: str, sigs: Dict[str, Sig], counter: List[int], issues: List[Issue]) -> None:
+    sig = sigs[name]
+    # init env with params (only read below: the body checks a copy)
+    env: Dict[str, Type] = dict(zip(sig.param_names, sig.param_types))
+
+    ret_seen: List[Type] = []
+    # one substitution reused (cleared) by every independent check below
+    subs: Subst = {}
+    # pointer stack for the whole function, like `_check_block` uses
+    ptr: List[Any] = ["functions", fi]
+
+    # requires/ensures
+    ptr.append("requires")
+    ptr.append(0)
+    for ri, req in enumerate(fn.get("requires") or ()):
+        ptr[-1] = ri
+        t = _infer_expr(req, env, ptr, issues, sigs, counter)
+        subs.clear()
+        if not unify(PRIM_BOOL, t, subs):
+            issues.append(Issue(join_pointer(ptr), "TypeMismatch", f"requires must be Bool, got {t}"))
+    del ptr[-2:]
+
+    # body
+    body = _list(fn, "body")
+    if body:
+        ptr.append("body")
+        _check_block(body, dict(env), ptr, issues, sigs, counter, sig.ret, ret_seen)
+        ptr.pop()
+
+    # missing return: if declared return not Null/Any and no return seen
+    if not ret_seen and sig.ret is not ANY and sig.ret is not PRIM_NULL:
+        issues.append(Issue(join_pointer(ptr), "MissingReturn", f"Function '{name}' may fall through without returning"))
+
+    # ensures: env includes result
+    ensures = fn.get("ensures") or ()
+    env_post = {**env, "result": sig.ret} if ensures else env
+    ptr.append("ensures")
+    ptr.append(0)
+    for ei, ens in enumerate(ensures):
+        ptr[-1] = ei
+        t = _infer_expr(ens, env_post, ptr, issues, sigs, counter)
+        subs.clear()
+        if not unify(PRIM_BOOL, t, subs):
+            issues.append(Issue(join_pointer(ptr), "TypeMismatch", f"ensures must be Bool, got {t}"))
+    del ptr[-2:]
+
+    # function-level tests (a monomorphic signature is its own instance)
+    mono = None if sig.type_params else sig
+    ptr.append("tests")
+    ptr.append(0)
+    for ti, tc in enumerate(_list(fn, "tests")):
+        if not isinstance(tc, dict):
+            continue
+        args = tc.get("args") or []
+        if not isinstance(args, list):
+            continue
+        ptr[-1] = ti
+        ptr.append("args")
+        ptr.append(0)
+        arg_types: List[Type] = []
+        for ai, a in enumerate(args):
+            ptr[-1] = ai
+            arg_types.append(_infer_expr(a, env, ptr, issues, sigs, counter))
+        del ptr[-2:]
+        inst = mono if mono is not None else _freshen(sig, counter)[0]
+        if len(arg_types) != len(inst.param_types):
+            issues.append(Issue(join_pointer(ptr), "TestArityMismatch", f"Test for {name} has wrong arity"))
+        else:
+            # shared by this test's args and expect
+            subs.clear()
+            for ai, (e, a) in enumerate(zip(inst.param_types, arg_types)):
+                if not unify(e, a, subs):
+                    issues.append(Issue(join_pointer([*ptr, "args", ai]), "TypeMismatch", f"Test arg expected {e} got {a}"))
+            ptr.append("expect")
+            exp_t = _infer_expr(tc.get("expect"), env, ptr, issues, sigs, counter)
+            if not unify(_apply(inst.ret, subs), exp_t, subs):
+                issues.append(Issue(join_pointer(ptr), "TypeMismatch", f"Expected {inst.ret} got {exp_t}"))
+            ptr.pop()
 
-    # build signatures
-    sigs: Dict[str, Sig] = _builtin_sigs()
-    for fn in module.get("functions", []) or []:
-        if isinstance(fn, dict) and isinstance(fn.get("name"), str):
-            sigs[fn["name"]] = _sig_from_function(fn)
 
-    counter = [0]  # for fresh vars
+# Per-function results reused across check_module calls (the repair loop and
+# the LSP server re-check mostly unchanged modules). A function's issues depend
+# only on its own JSON, its index, the signatures of every function in the
+# module, and the fresh-variable counter it starts from (fresh names such as
+# `T#3` appear in messages), so all of those go into the key.
+#
+# Hashing every function costs a fair share of a cold check, so keys are only
+# computed for modules whose signatures were seen before: a one-off check pays
+# for the signature digest alone.
+_FN_CACHE_MAX = 256
+_FN_CACHE: "OrderedDict[bytes, Tuple[List[Issue], int]]" = OrderedDict()
+_SEEN_SIGS_MAX = 64
+_SEEN_SIGS: "OrderedDict[bytes, None]" = OrderedDict()
+
+_SIG_KEYS = ("name", "params", "type_params", "param_types", "returns")
+
+
+def _sigs_digest(functions: List[Any]) -> Optional[bytes]:
+    shape = [[f.get(k) for k in _SIG_KEYS] if isinstance(f, dict) else None for f in functions]
+    data = _json.dumps_key(shape)
+    return None if data is None else hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _fn_cache_key(fn: Dict[str, Any], fi: int, sigs_digest: bytes, counter: int) -> Optional[bytes]:
+    # key order matters (record field order affects checking) and is kept
+    data = _json.dumps_key(fn)
+    if data is None:
+        return None
+    h = hashlib.blake2b(sigs_digest, digest_size=16)
+    h.update(f"{fi}:{counter}:".encode("utf-8"))
+    h.update(data)
+    return h.digest()
+
+
+class _TooManyIssues(Exception):
+    """Raised by `_IssueSink` once the issue budget is spent."""
+
+
+class _IssueSink(list):
+    """Issue list that aborts the check once `limit` issues are collected."""
+
+    __slots__ = ("limit",)
+
+    def __init__(self, limit: int) -> None:
+        super().__init__()
+        self.limit = limit
+
+    def append(self, issue: Issue) -> None:
+        super().append(issue)
+        if len(self) >= self.limit:
+            raise _TooManyIssues
+
+    def extend(self, items: Any) -> None:
+        super().extend(items)
+        if len(self) >= self.limit:
+            del self[self.limit:]
+            raise _TooManyIssues
+
+
+# (index in module["functions"], function) for every entry with a string name
+_NamedFns = List[Tuple[int, Dict[str, Any]]]
+
+
+def _named_functions(functions: List[Any]) -> _NamedFns:
+    return [(fi, fn) for fi, fn in enumerate(functions) if isinstance(fn, dict) and isinstance(fn.get("name"), str)]
+
+
+def _module_sigs(named: _NamedFns) -> Dict[str, Sig]:
+    sigs: Dict[str, Sig] = dict(_BUILTIN_SIGS)
+    for _, fn in named:
+        sigs[fn["name"]] = _sig_from_function(fn)
+    return sigs
+
+
+def _check_functions(functions: List[Any], named: _NamedFns, sigs: Dict[str, Sig], counter: List[int], issues: List[Issue]) -> None:
+    sigs_digest = _sigs_digest(functions)
+    if sigs_digest is not None and sigs_digest not in _SEEN_SIGS:
+        _SEEN_SIGS[sigs_digest] = None
+        if len(_SEEN_SIGS) > _SEEN_SIGS_MAX:
+            _SEEN_SIGS.popitem(last=False)
+        sigs_digest = None
+    elif sigs_digest is not None:
+        _SEEN_SIGS.move_to_end(sigs_digest)
 
     # typecheck each function
-    for fi, fn in enumerate(module.get("functions", []) or []):
-        if not isinstance(fn, dict):
-            continue
-        name = fn.get("name")
-        if not isinstance(name, str):
+    for fi, fn in named:
+        key = None if sigs_digest is None else _fn_cache_key(fn, fi, sigs_digest, counter[0])
+        hit = None if key is None else _FN_CACHE.get(key)
+        if hit is not None:
+            _FN_CACHE.move_to_end(key)
+            issues.extend(hit[0])
+            counter[0] = hit[1]
             continue
-        sig = sigs[name]
-        # init env with params
-        env: Dict[str, Type] = {}
-        for p, t in zip(sig.param_names, sig.param_types):
-            env[p] = t
-
-        ret_seen: List[Type] = []
-
-        # requires/ensures
-        for ri, req in enumerate(fn.get("requires", []) or []):
-            t = _infer_expr(req, env, ["functions", fi, "requires", ri], issues, sigs, counter)
-            subs: Subst = {}
-            if not unify(Prim("Bool"), t, subs):
-                issues.append(Issue(join_pointer(["functions", fi, "requires", ri]), "TypeMismatch", f"requires must be Bool, got {t}"))
-
-        # body
-        body = fn.get("body", []) or []
-        if isinstance(body, list):
-            _check_block(body, env, ["functions", fi, "body"], issues, sigs, counter, sig.ret, ret_seen)
-
-        # missing return: if declared return not Null/Any and no return seen
-        if not ret_seen and not isinstance(sig.ret, AnyType) and not (isinstance(sig.ret, Prim) and sig.ret.name == "Null"):
-            issues.append(Issue(join_pointer(["functions", fi]), "MissingReturn", f"Function '{name}' may fall through without returning"))
-
-        # ensures: env includes result
-        env_post = dict(env)
-        env_post["result"] = sig.ret
-        for ei, ens in enumerate(fn.get("ensures", []) or []):
-            t = _infer_expr(ens, env_post, ["functions", fi, "ensures", ei], issues, sigs, counter)
-            subs: Subst = {}
-            if not unify(Prim("Bool"), t, subs):
-                issues.append(Issue(join_pointer(["functions", fi, "ensures", ei]), "TypeMismatch", f"ensures must be Bool, got {t}"))
-
-        # function-level tests
-        for ti, tc in enumerate(fn.get("tests", []) or []):
-            if not isinstance(tc, dict):
-                continue
-            args = tc.get("args", []) or []
-            if not isinstance(args, list):
-                continue
-            arg_types = [_infer_expr(a, env, ["functions", fi, "tests", ti, "args", ai], issues, sigs, counter) for ai, a in enumerate(args)]
-            inst, _ = _freshen(sig, counter)
-            if len(arg_types) != len(inst.param_types):
-                issues.append(Issue(join_pointer(["functions", fi, "tests", ti]), "TestArityMismatch", f"Test for {name} has wrong arity"))
-            else:
-                subs: Subst = {}
-                for ai, (e, a) in enumerate(zip(inst.param_types, arg_types)):
-                    if not unify(e, a, subs):
-                        issues.append(Issue(join_pointer(["functions", fi, "tests", ti, "args", ai]), "TypeMismatch", f"Test arg expected {e} got {a}"))
-                exp = tc.get("expect")
-                exp_t = _infer_expr(exp, env, ["functions", fi, "tests", ti, "expect"], issues, sigs, counter)
-                if not unify(_apply(inst.ret, subs), exp_t, subs):
-                    issues.append(Issue(join_pointer(["functions", fi, "tests", ti, "expect"]), "TypeMismatch", f"Expected {inst.ret} got {exp_t}"))
+        start = len(issues)
+        _check_function(fn, fi, fn["name"], sigs, counter, issues)
+        if key is not None:
+            _FN_CACHE[key] = (issues[start:], counter[0])
+            if len(_FN_CACHE) > _FN_CACHE_MAX:
+                _FN_CACHE.popitem(last=False)
+
+
+# Below this many functions, starting worker processes costs more than it saves.
+_PARALLEL_MIN_FUNCTIONS = 4
+
+# Set in each worker process by `_init_worker`.
+_worker_functions: List[Any] = []
+_worker_sigs: Dict[str, Sig] = {}
+
+
+def _init_worker(functions: List[Any]) -> None:
+    global _worker_functions, _worker_sigs
+    _worker_functions = functions
+    _worker_sigs = _module_sigs(_named_functions(functions))
+
+
+def _check_chunk(work: List[Tuple[int, int]]) -> List[Tuple[List[Issue], int]]:
+    """Check functions given as (index, fresh-variable counter start) pairs."""
+    out: List[Tuple[List[Issue], int]] = []
+    for fi, start in work:
+        fn = _worker_functions[fi]
+        counter = [start]
+        fn_issues: List[Issue] = []
+        _check_function(fn, fi, fn["name"], _worker_sigs, counter, fn_issues)
+        out.append((fn_issues, counter[0] - start))
+    return out
+
+
+def _map_chunks(pool: concurrent.futures.Executor, work: List[Tuple[int, int]], jobs: int) -> List[Tuple[List[Issue], int]]:
+    size = max(1, len(work) // (jobs * 4))
+    chunks = [work[i:i + size] for i in range(0, len(work), size)]
+    return [r for chunk_results in pool.map(_check_chunk, chunks) for r in chunk_results]
+
+
+def _check_functions_parallel(functions: List[Any], named: _NamedFns, sigs: Dict[str, Sig], counter: List[int], issues: List[Issue], jobs: int) -> None:
+    """Check every function in a process pool; issues come out in function order.
+
+    How many fresh type variables a function uses does not depend on where
+    the counter starts, so a first round checks every function from 0 and
+    the real starting points are summed afterwards. Only a function that used
+    fresh variables, reported issues and does not start at 0 can word its
+    issues differently from a serial run; those are checked again from their
+    real start in a second round.
+    """
+    todo = [fi for fi, _ in named]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(functions,)) as pool:
+        results = _map_chunks(pool, [(fi, 0) for fi in todo], jobs)
+        redo: List[Tuple[int, int]] = []
+        redo_at: List[int] = []
+        start = counter[0]
+        for i, (fi, (fn_issues, used)) in enumerate(zip(todo, results)):
+            if used and fn_issues and start:
+                redo.append((fi, start))
+                redo_at.append(i)
+            start += used
+        if redo:
+            for i, result in zip(redo_at, _map_chunks(pool, redo, jobs)):
+                results[i] = result
+    for fn_issues, used in results:
+        issues.extend(fn_issues)
+        counter[0] += used
+
+
+def check_module(module: Dict[str, Any], *, max_issues: Optional[int] = None, jobs: int = 1) -> List[Dict[str, Any]]:
+    """Typecheck `module` and return its issues as dicts.
+
+    With `max_issues`, checking stops as soon as that many issues have been
+    found and only those are returned: after the first few errors the rest of
+    a broken program is rarely worth checking.
+
+    With `jobs > 1` and enough functions, functions are checked in a process
+    pool; the issues are the same, in the same order, as a serial run.
+    """
+    issues: List[Issue] = _IssueSink(max_issues) if max_issues else []
+    functions = _list(module, "functions")
+    named = _named_functions(functions)
+
+    # build signatures
+    sigs = _module_sigs(named)
+
+    try:
+        _check_module_body(module, functions, named, sigs, issues, jobs)
+    except _TooManyIssues:
+        pass
+    return [i.to_dict() for i in issues]
+
+
+def _check_module_body(module: Dict[str, Any], functions: List[Any], named: _NamedFns, sigs: Dict[str, Sig], issues: List[Issue], jobs: int) -> None:
+    counter = [0]  # for fresh vars
+    if jobs > 1 and len(named) >= _PARALLEL_MIN_FUNCTIONS:
+        _check_functions_parallel(functions, named, sigs, counter, issues, jobs)
+    else:
+        _check_functions(functions, named, sigs, counter, issues)
 
     # module-level tests
-    for ti, tc in enumerate(module.get("tests", []) or []):
+    subs: Subst = {}
+    for ti, tc in enumerate(_list(module, "tests")):
         if not isinstance(tc, dict):
             continue
         fn_name = tc.get("fn")
@@ -889,16 +1414,16 @@ def check_module(module: Dict[str, Any]) -> List[Dict[str, Any]]:
             issues.append(Issue(join_pointer(["tests", ti, "fn"]), "UnknownFunctionCall", f"Unknown function: {fn_name}"))
             continue
         sig = sigs[fn_name]
-        args = tc.get("args", []) or []
+        args = tc.get("args") or []
         if not isinstance(args, list):
             continue
         env: Dict[str, Type] = {}
         arg_types = [_infer_expr(a, env, ["tests", ti, "args", ai], issues, sigs, counter) for ai, a in enumerate(args)]
-        inst, _ = _freshen(sig, counter)
+        inst = _freshen(sig, counter)[0] if sig.type_params else sig
         if len(arg_types) != len(inst.param_types):
             issues.append(Issue(join_pointer(["tests", ti]), "TestArityMismatch", f"Test for {fn_name} has wrong arity"))
         else:
-            subs: Subst = {}
+            subs.clear()
             for ai, (e, a) in enumerate(zip(inst.param_types, arg_types)):
                 if not unify(e, a, subs):
                     issues.append(Issue(join_pointer(["tests", ti, "args", ai]), "TypeMismatch", f"Test arg expected {e} got {a}"))
@@ -906,24 +1431,24 @@ def check_module(module: Dict[str, Any]) -> List[Dict[str, Any]]:
             if not unify(_apply(inst.ret, subs), exp_t, subs):
                 issues.append(Issue(join_pointer(["tests", ti, "expect"]), "TypeMismatch", f"Expected {inst.ret} got {exp_t}"))
 
-    return [i.to_dict() for i in issues]
-
 
 def main(argv: List[str] | None = None) -> int:
     ap = argparse.ArgumentParser(prog="astra typecheck")
     ap.add_argument("path", help="Path to Astra module JSON")
     ap.add_argument("--json", action="store_true", help="Emit issues as JSON")
+    ap.add_argument("--max-issues", type=int, default=None, help="Stop after N issues (default: no limit)")
+    ap.add_argument("--jobs", type=int, default=1, help="Check functions in N worker processes")
     args = ap.parse_args(argv)
 
     try:
-        module = json.loads(Path(args.path).read_text(encoding="utf-8"))
+        module = _json.load_path(args.path)
     except Exception as e:
         print(f"Failed to read/parse JSON: {e}", file=sys.stderr)
         return 3
 
-    issues = check_module(module)
+    issues = check_module(module, max_issues=args.max_issues, jobs=args.jobs)
     if args.json:
-        print(json.dumps(issues, indent=2, ensure_ascii=False))
+        print(_json.dumps_indented(issues))
     else:
         for i in issues:
             print(f"{i['code']} {i['pointer']}: {i['message']}")